@@ -19,7 +19,6 @@ Usage:
 """
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
@@ -27,6 +26,7 @@ from pathlib import Path
 from src.parsers import parse_text_llm, parse_transcript_llm, parse_transcript_pdf, parse_transcript_url
 from src.extractors import extract_simple
 from src.scrapers.imsdb import IMSDbScraper
+from src.utils.json_utils import json_dumps
 
 
 def setup_logging(verbose: bool = False):
@@ -38,6 +38,13 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def write_stdout(data: bytes):
+    """Write UTF-8 output as bytes, so non-UTF-8 consoles can't fail to encode it."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def cmd_parse(args):
     """Parse a screenplay or transcript file."""
     path = Path(args.file)
@@ -49,20 +56,26 @@ def cmd_parse(args):
     title = args.title or None
     year = args.year
 
-    if path.suffix.lower() == ".pdf":
+    data = path.read_bytes()
+    suffix = path.suffix.lower()
+
+    if suffix == ".pdf":
         result = parse_transcript_pdf(
-            path,
+            data,
             movie_id=movie_id,
             title=title,
             year=year,
-            verbose=args.verbose
+            verbose=args.verbose,
+            use_cache=not args.no_cache
         )
     else:
-        text = extract_simple(path)
+        # PyMuPDF also reads HTML, EPUB, XPS and the like; plain text is decoded directly
+        text = None
+        if suffix and suffix != ".txt":
+            text = extract_simple(data, filetype=suffix.lstrip("."))
         if not text:
-            with open(path, 'r', encoding='utf-8') as f:
-                text = f.read()
-        
+            text = data.decode('utf-8', errors='replace')
+
         if not text:
             print(f"Error: Failed to extract text from {path}", file=sys.stderr)
             sys.exit(1)
@@ -73,17 +86,18 @@ def cmd_parse(args):
             movie_id=movie_id,
             title=title,
             year=year,
-            verbose=args.verbose
+            verbose=args.verbose,
+            use_cache=not args.no_cache
         )
 
     if result:
-        output = result.to_dict()
+        output = json_dumps(result.to_dict(), indent=True)
         if args.output:
             output_path = Path(args.output)
-            output_path.write_text(json.dumps(output, indent=2))
+            output_path.write_bytes(output)
             print(f"Saved to: {output_path}")
         else:
-            print(json.dumps(output, indent=2))
+            write_stdout(output)
     else:
         print("Error: Parsing failed", file=sys.stderr)
         sys.exit(1)
@@ -100,17 +114,18 @@ def cmd_parse_url(args):
         movie_id=movie_id,
         title=title,
         year=year,
-        verbose=args.verbose
+        verbose=args.verbose,
+        use_cache=not args.no_cache
     )
 
     if result:
-        output = result.to_dict()
+        output = json_dumps(result.to_dict(), indent=True)
         if args.output:
             output_path = Path(args.output)
-            output_path.write_text(json.dumps(output, indent=2))
+            output_path.write_bytes(output)
             print(f"Saved to: {output_path}")
         else:
-            print(json.dumps(output, indent=2))
+            write_stdout(output)
     else:
         print("Error: Parsing failed", file=sys.stderr)
         sys.exit(1)
@@ -137,6 +152,7 @@ def main():
         description="Parse screenplays into scriptdle format"
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the URL and LLM response caches")
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
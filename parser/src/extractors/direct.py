@@ -8,6 +8,9 @@ No fallbacks - returns None if extraction fails or produces garbage.
 """
 
 import logging
+import re
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Union
 
@@ -17,6 +20,12 @@ logger = logging.getLogger(__name__)
 
 MIN_TEXT_CHARS_PER_PAGE = 100
 MAX_GARBAGE_RATIO = 0.20
+GARBAGE_SAMPLE_CHARS = 3000
+
+# Approximate width in points of one character of screenplay text
+CHAR_WIDTH = 6
+
+GARBAGE_LINE_PATTERN = re.compile(r'^[\W\d_\s]{3,}$')
 
 
 def extract_direct(source: Union[str, Path, bytes]) -> Optional[str]:
@@ -38,26 +47,30 @@ def extract_direct(source: Union[str, Path, bytes]) -> Optional[str]:
     return _extract_generic(source, preserve_layout=True)
 
 
-def extract_simple(source: Union[str, Path, bytes]) -> Optional[str]:
+def extract_simple(source: Union[str, Path, bytes], filetype: str = "pdf") -> Optional[str]:
     """
     Extract embedded text from a PDF without layout preservation.
     
     Simpler and faster than extract_direct, suitable for transcripts.
+    Other documents PyMuPDF can open (HTML, XHTML, EPUB, XPS, FB2) work too.
     
     Args:
         source: PDF file path or bytes
+        filetype: Document type of bytes sources (e.g. "pdf", "epub", "html")
         
     Returns:
         Extracted text flow, or None if extraction fails
     """
-    return _extract_generic(source, preserve_layout=False)
+    return _extract_generic(source, preserve_layout=False, filetype=filetype)
 
 
-def _extract_generic(source: Union[str, Path, bytes], preserve_layout: bool = True) -> Optional[str]:
+def _extract_generic(
+    source: Union[str, Path, bytes], preserve_layout: bool = True, filetype: str = "pdf"
+) -> Optional[str]:
     """Generic PDF text extraction."""
     try:
         if isinstance(source, bytes):
-            doc = fitz.open(stream=source, filetype="pdf")
+            doc = fitz.open(stream=source, filetype=filetype)
         else:
             path = Path(source)
             if not path.exists():
@@ -67,16 +80,28 @@ def _extract_generic(source: Union[str, Path, bytes], preserve_layout: bool = Tr
         
         all_text = []
         pages_with_text = 0
+        sampled_chars = 0
+        garbage_checked = not preserve_layout
         
         for page in doc:
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
             if preserve_layout:
-                page_text = _extract_page_with_layout(page)
+                page_text = _extract_page_with_layout(page, textpage=textpage)
             else:
-                page_text = page.get_text("text")
+                page_text = page.get_text("text", textpage=textpage)
                 
             all_text.append(page_text)
             if len(page_text.strip()) >= MIN_TEXT_CHARS_PER_PAGE:
                 pages_with_text += 1
+            
+            if not garbage_checked:
+                sampled_chars += len(page_text) + 2
+                if sampled_chars >= GARBAGE_SAMPLE_CHARS:
+                    garbage_checked = True
+                    if _has_garbage_text("\n\n".join(all_text)):
+                        logger.debug("Text has garbage patterns")
+                        doc.close()
+                        return None
         
         doc.close()
         
@@ -90,7 +115,7 @@ def _extract_generic(source: Union[str, Path, bytes], preserve_layout: bool = Tr
             logger.debug(f"Total text too short: {len(combined.strip())} chars")
             return None
         
-        if preserve_layout and _has_garbage_text(combined):
+        if not garbage_checked and _has_garbage_text(combined):
             logger.debug("Text has garbage patterns")
             return None
         
@@ -101,43 +126,39 @@ def _extract_generic(source: Union[str, Path, bytes], preserve_layout: bool = Tr
         return None
 
 
-def _extract_page_with_layout(page) -> str:
+def _extract_page_with_layout(page, textpage=None) -> str:
     """
     Extract text from a single page preserving horizontal positioning.
     
-    Groups text by Y position, then reconstructs lines with indentation
-    based on X position.
+    Groups words into their PDF lines, then reconstructs rows by Y position
+    with indentation based on X position. Gaps between words are rebuilt
+    from their positions, so runs of spaces within a line survive. Pass a
+    prebuilt ``textpage`` to reuse MuPDF's parsed text across several
+    extractions of the same page.
     """
-    blocks = page.get_text("dict")["blocks"]
+    words = page.get_text("words", textpage=textpage)
     
-    lines = {}
+    entries = []
     
-    for block in blocks:
-        if block["type"] != 0:
-            continue
-        for line in block.get("lines", []):
-            bbox = line["bbox"]
-            y_pos = int(bbox[1])
-            x_pos = int(bbox[0])
-            
-            text_parts = []
-            for span in line.get("spans", []):
-                text_parts.append(span["text"])
-            line_text = "".join(text_parts)
-            
-            if not line_text.strip():
-                continue
-            
-            if y_pos not in lines:
-                lines[y_pos] = []
-            lines[y_pos].append((x_pos, line_text))
+    for _, line_words in groupby(words, key=itemgetter(5, 6)):
+        line_words = list(line_words)
+        y_pos = int(min(word[1] for word in line_words))
+        x_pos = int(line_words[0][0])
+        parts = [line_words[0][4]]
+        for prev, word in zip(line_words, line_words[1:]):
+            parts.append(" " * max(1, round((word[0] - prev[2]) / CHAR_WIDTH)))
+            parts.append(word[4])
+        line_text = "".join(parts)
+        entries.append((y_pos, x_pos, line_text))
+    
+    entries.sort(key=itemgetter(0, 1))
     
     output_lines = []
-    for y_pos in sorted(lines.keys()):
-        line_parts = sorted(lines[y_pos], key=lambda x: x[0])
-        first_x = line_parts[0][0]
-        indent = int(first_x / 6)
-        text = " ".join(part[1] for part in line_parts)
+    for _, group in groupby(entries, key=itemgetter(0)):
+        line_parts = list(group)
+        first_x = line_parts[0][1]
+        indent = int(first_x / CHAR_WIDTH)
+        text = " ".join(part[2] for part in line_parts)
         output_lines.append(" " * indent + text)
     
     return "\n".join(output_lines)
@@ -151,24 +172,22 @@ def _has_garbage_text(text: str) -> bool:
     - Low alphabetic character ratio
     - Lines of mostly symbols
     """
-    import re
-    
-    lines = text[:3000].split('\n')
+    lines = text[:GARBAGE_SAMPLE_CHARS].split('\n')
     garbage_lines = 0
     checked_lines = 0
     
-    for line in lines[:50]:
+    for line in islice(lines, 50):
         line = line.strip()
         if not line:
             continue
         checked_lines += 1
         
-        alpha_count = sum(1 for c in line if c.isalpha())
+        alpha_count = sum(map(str.isalpha, line))
         if len(line) > 3 and alpha_count / len(line) < 0.3:
             garbage_lines += 1
             continue
         
-        if re.match(r'^[\W\d_\s]{3,}$', line):
+        if not alpha_count and GARBAGE_LINE_PATTERN.match(line):
             garbage_lines += 1
     
     if checked_lines == 0:
@@ -10,8 +10,20 @@ from typing import Optional
 
 from bs4 import BeautifulSoup, NavigableString
 
+from ..utils.html_utils import HTML_PARSER
+
 logger = logging.getLogger(__name__)
 
+# id attribute -> (text template, is_bold, indent) for IMSDb-style markup
+SCREENPLAY_ID_TEMPLATES = {
+    'speaker': ('{}', True, 37),
+    'dia': ('{}', False, 25),
+    'slug': ('{}', True, 0),
+    'act': ('{}', False, 0),
+    'spkdir': ('({})', False, 31),
+}
+SCREENPLAY_ID_SELECTOR = ', '.join(f'[id="{elem_id}" i]' for elem_id in SCREENPLAY_ID_TEMPLATES)
+
 
 def extract_html(html: str) -> str:
     """
@@ -26,7 +38,7 @@ def extract_html(html: str) -> str:
     Returns:
         Extracted plain text
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     
     for script in soup(["script", "style"]):
         script.decompose()
@@ -62,7 +74,7 @@ def extract_html_structured(html: str) -> list[dict]:
     html = html.replace('\x94', '"')
     html = html.replace('&amp;', '&')
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     
     for script in soup(["script", "style"]):
         script.decompose()
@@ -78,25 +90,24 @@ def extract_html_structured(html: str) -> list[dict]:
     elements = []
     
     def get_indent_level(text: str) -> int:
-        if not text:
-            return 0
-        expanded = text.replace('\t', '        ')
-        stripped = expanded.lstrip()
-        return len(expanded) - len(stripped)
+        # Width of the leading whitespace with each tab counted as 8 columns
+        leading = len(text) - len(text.lstrip())
+        return leading + 7 * text.count('\t', 0, leading)
     
-    def process_node(node, is_bold=False, depth=0):
-        if depth > 100:
-            return
+    stack = [(pre_tag, False)]
+    while stack:
+        node, is_bold = stack.pop()
         
         if isinstance(node, NavigableString):
             text = str(node)
             for line in text.split('\n'):
-                if line.strip():
+                content = line.strip()
+                if content:
                     elements.append({
                         'text': line.rstrip(),
                         'is_bold': is_bold,
                         'indent': get_indent_level(line),
-                        'content': line.strip()
+                        'content': content
                     })
         else:
             tag_is_bold = is_bold or node.name == 'b'
@@ -104,10 +115,8 @@ def extract_html_structured(html: str) -> list[dict]:
             if node_id in ('speaker', 'slug'):
                 tag_is_bold = True
             
-            for child in node.children:
-                process_node(child, tag_is_bold, depth + 1)
+            stack.extend((child, tag_is_bold) for child in reversed(node.contents))
     
-    process_node(pre_tag)
     return elements
 
 
@@ -124,7 +133,7 @@ def extract_wiki(html: str) -> str:
     Returns:
         Clean transcript text
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     unwanted_selectors = [
         'script', 'style',
@@ -138,8 +147,8 @@ def extract_wiki(html: str) -> str:
         'table',
     ]
 
-    for selector in unwanted_selectors:
-        for elem in soup.select(selector):
+    for elem in soup.select(", ".join(unwanted_selectors)):
+        if not elem.decomposed:
             elem.decompose()
 
     main_content = None
@@ -179,31 +188,18 @@ def _extract_id_based(soup) -> list[dict]:
     """
     elements = []
 
-    def get_direct_text(elem):
-        texts = []
-        for child in elem.children:
-            if isinstance(child, NavigableString):
-                text = str(child).strip()
-                if text:
-                    texts.append(text)
-        return ' '.join(texts)
-
-    for elem in soup.find_all(attrs={'id': True}):
-        elem_id = elem.get('id', '').lower()
-        text = get_direct_text(elem)
+    for elem in soup.select(SCREENPLAY_ID_SELECTOR):
+        template, is_bold, indent = SCREENPLAY_ID_TEMPLATES[elem['id'].lower()]
+        text = ' '.join(
+            child.strip()
+            for child in elem.find_all(string=True, recursive=False)
+            if child.strip()
+        )
 
         if not text:
             continue
 
-        if elem_id == 'speaker':
-            elements.append({'text': text, 'content': text, 'is_bold': True, 'indent': 37})
-        elif elem_id == 'dia':
-            elements.append({'text': text, 'content': text, 'is_bold': False, 'indent': 25})
-        elif elem_id == 'slug':
-            elements.append({'text': text, 'content': text, 'is_bold': True, 'indent': 0})
-        elif elem_id == 'act':
-            elements.append({'text': text, 'content': text, 'is_bold': False, 'indent': 0})
-        elif elem_id == 'spkdir':
-            elements.append({'text': f'({text})', 'content': f'({text})', 'is_bold': False, 'indent': 31})
+        text = template.format(text)
+        elements.append({'text': text, 'content': text, 'is_bold': is_bold, 'indent': indent})
 
     return elements
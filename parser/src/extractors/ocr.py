@@ -8,7 +8,12 @@ Use when direct extraction fails (image-based PDFs).
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Optional, Union
 
 try:
@@ -19,6 +24,12 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+try:
+    from tesserocr import PyTessBaseAPI, PSM, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +37,7 @@ def extract_ocr(
     source: Union[str, Path, bytes],
     dpi: int = 200,
     max_pages: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> Optional[str]:
     """
     Extract text from a PDF using Tesseract OCR.
@@ -36,6 +48,7 @@ def extract_ocr(
         source: PDF file path or bytes
         dpi: Resolution for rendering PDF pages (higher = better quality, slower)
         max_pages: Maximum pages to process (None = all)
+        max_workers: Pages to OCR in parallel (None = one per CPU)
         
     Returns:
         Extracted text with layout preserved, or None if extraction fails
@@ -45,22 +58,22 @@ def extract_ocr(
         return None
         
     try:
+        last_page = max_pages or None
         if isinstance(source, bytes):
-            images = convert_from_bytes(source, dpi=dpi)
+            images = convert_from_bytes(
+                source, dpi=dpi, last_page=last_page, thread_count=os.cpu_count() or 1
+            )
         else:
             path = Path(source)
             if not path.exists():
                 logger.debug(f"File not found: {path}")
                 return None
-            images = convert_from_path(str(path), dpi=dpi)
+            images = convert_from_path(
+                str(path), dpi=dpi, last_page=last_page, thread_count=os.cpu_count() or 1
+            )
         
-        if max_pages:
-            images = images[:max_pages]
-        
-        all_text = []
-        for page_num, img in enumerate(images):
-            page_text = _ocr_page_with_layout(img)
-            all_text.append(page_text)
+        all_text = _ocr_images(images, max_workers)
+        for page_num, page_text in enumerate(all_text):
             logger.debug(f"OCR page {page_num + 1}: {len(page_text)} chars")
         
         return "\n\n".join(all_text)
@@ -70,6 +83,67 @@ def extract_ocr(
         return None
 
 
+def _ocr_images(images: list, max_workers: Optional[int] = None) -> list[str]:
+    """
+    OCR page images concurrently, returning text in page order.
+    
+    With tesserocr installed, each worker reuses a persistent in-process
+    Tesseract instance. Otherwise, or if tesserocr fails to initialize,
+    every page goes through a pytesseract subprocess; either way threads
+    keep every core busy without pickling page images.
+    """
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(images)))
+    
+    if TESSEROCR_AVAILABLE:
+        apis = SimpleQueue()
+        
+        def ocr_page(img) -> str:
+            api = apis.get()
+            try:
+                return _tesserocr_page_with_layout(api, img)
+            finally:
+                apis.put(api)
+        
+        try:
+            try:
+                for _ in range(workers):
+                    apis.put(PyTessBaseAPI(psm=PSM.SINGLE_COLUMN))
+            except RuntimeError as e:
+                logger.error(f"tesserocr init failed, falling back to pytesseract: {e}")
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(ocr_page, images))
+        finally:
+            while not apis.empty():
+                apis.get().End()
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_ocr_page_with_layout, images))
+
+
+def _tesserocr_page_with_layout(api, img) -> str:
+    """
+    OCR a single page image with a reusable tesserocr API instance.
+    
+    Uses the same indentation rule as _ocr_page_with_layout, but lines come
+    from Tesseract's TEXTLINE iterator rather than pytesseract's word rows,
+    so line breaks and ordering can differ slightly between the two.
+    """
+    api.SetImage(img)
+    api.Recognize()
+    
+    output_lines = []
+    for line in iterate_level(api.GetIterator(), RIL.TEXTLINE):
+        text = line.GetUTF8Text(RIL.TEXTLINE)
+        if not text or not text.strip():
+            continue
+        first_x = line.BoundingBox(RIL.TEXTLINE)[0]
+        indent = int(first_x / 12)
+        output_lines.append(' ' * indent + ' '.join(text.split()))
+    
+    return '\n'.join(output_lines)
+
+
 def _ocr_page_with_layout(img) -> str:
     """
     OCR a single page image preserving horizontal positioning.
@@ -79,23 +153,21 @@ def _ocr_page_with_layout(img) -> str:
     """
     data = pytesseract.image_to_data(img, config='--psm 4', output_type=Output.DICT)
     
-    lines = {}
-    for i, text in enumerate(data['text']):
-        if text.strip():
-            block_num = data['block_num'][i]
-            line_num = data['line_num'][i]
-            key = (block_num, line_num)
-            x = data['left'][i]
-            if key not in lines:
-                lines[key] = []
-            lines[key].append((x, text))
+    words = [
+        (block_num, line_num, x, text)
+        for text, block_num, line_num, x in zip(
+            data['text'], data['block_num'], data['line_num'], data['left']
+        )
+        if text.strip()
+    ]
+    words.sort(key=itemgetter(0, 1, 2))
     
     output_lines = []
-    for key in sorted(lines.keys()):
-        words = sorted(lines[key], key=lambda w: w[0])
-        first_x = words[0][0]
+    for _, line_words in groupby(words, key=itemgetter(0, 1)):
+        line_words = list(line_words)
+        first_x = line_words[0][2]
         indent = int(first_x / 12)
-        line_text = ' ' * indent + ' '.join(w[1] for w in words)
+        line_text = ' ' * indent + ' '.join(w[3] for w in line_words)
         output_lines.append(line_text)
     
     return '\n'.join(output_lines)
@@ -104,6 +176,7 @@ def _ocr_page_with_layout(img) -> str:
 def extract_ocr_pages(
     source: Union[str, Path, bytes],
     dpi: int = 200,
+    max_workers: Optional[int] = None,
 ) -> list[str]:
     """
     Extract text from each PDF page separately using OCR.
@@ -111,6 +184,7 @@ def extract_ocr_pages(
     Args:
         source: PDF file path or bytes
         dpi: Resolution for rendering PDF pages
+        max_workers: Pages to OCR in parallel (None = one per CPU)
         
     Returns:
         List of extracted text, one per page
@@ -121,19 +195,14 @@ def extract_ocr_pages(
         
     try:
         if isinstance(source, bytes):
-            images = convert_from_bytes(source, dpi=dpi)
+            images = convert_from_bytes(source, dpi=dpi, thread_count=os.cpu_count() or 1)
         else:
             path = Path(source)
             if not path.exists():
                 return []
-            images = convert_from_path(str(path), dpi=dpi)
-        
-        pages = []
-        for img in images:
-            page_text = _ocr_page_with_layout(img)
-            pages.append(page_text)
+            images = convert_from_path(str(path), dpi=dpi, thread_count=os.cpu_count() or 1)
         
-        return pages
+        return _ocr_images(images, max_workers)
         
     except Exception as e:
         logger.error(f"OCR page extraction failed: {e}")
@@ -1,5 +1,5 @@
 """
-PDF JSON Extractor using pdfplumber
+PDF JSON Extractor
 
 Extracts structured data from PDFs including:
 - Text content with bounding boxes
@@ -7,13 +7,24 @@ Extracts structured data from PDFs including:
 - Margin positions
 
 This data can be used for margin-based element classification.
+Uses PyMuPDF by default; pdfplumber remains available as a backend
+for documents where its word grouping is preferred (e.g. tables).
 """
 
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Iterator, Optional, Union
 from dataclasses import dataclass
 
+import fitz
+
+from ..utils.json_utils import json_dumps
+
 try:
     import pdfplumber
     PDFPLUMBER_AVAILABLE = True
@@ -23,10 +34,22 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ("pymupdf", "pdfplumber")
+
+# Below this, process start-up costs more than PyMuPDF spends on the pages.
+MIN_PAGES_FOR_POOL = 64
+
+# Subset fonts are named like "ABCDEF+Courier"; PyMuPDF already drops the tag
+FONT_SUBSET_PREFIX_PATTERN = re.compile(r'^[A-Z]{6}\+')
 
-@dataclass
+
+@dataclass(slots=True)
 class TextElement:
-    """Represents a text element extracted from PDF."""
+    """Represents a text element extracted from PDF.
+
+    font_name is the base font name, without any "ABCDEF+" subset prefix,
+    whichever backend produced it.
+    """
     text: str
     x0: float
     x1: float
@@ -49,7 +72,7 @@ class TextElement:
         return (self.x0 + self.x1) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class PageData:
     """Represents extracted data from a single page."""
     page_num: int
@@ -58,7 +81,7 @@ class PageData:
     elements: list[TextElement]
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFData:
     """Represents extracted data from an entire PDF."""
     path: Path
@@ -74,25 +97,134 @@ class PDFData:
         return elements
 
 
+def _extract_pymupdf_page(page: "fitz.Page", page_num: int) -> PageData:
+    """
+    Extract data from a single PyMuPDF page.
+
+    Word boxes come from get_text("words"); fonts are looked up from the
+    span of the same line (sharing one TextPage keeps block/line numbers
+    aligned between the two views).
+    """
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_WORDS)
+
+    words = page.get_text("words", textpage=textpage)
+    if not words:
+        # Image-only page (e.g. a scanned title page): skip the font lookup
+        return PageData(page_num=page_num, width=page.rect.width, height=page.rect.height, elements=[])
+
+    line_spans = {}
+    for block in page.get_text("dict", textpage=textpage)["blocks"]:
+        for line_num, line in enumerate(block.get("lines", ())):
+            line_spans[(block["number"], line_num)] = [
+                (span["bbox"][0], span["font"], span["size"]) for span in line["spans"]
+            ]
+
+    elements = []
+    for x0, top, x1, bottom, text, block_num, line_num, _ in words:
+        spans = line_spans.get((block_num, line_num))
+        font_name = font_size = None
+        if spans:
+            _, font_name, font_size = spans[0]
+            for span_x0, span_font, span_size in spans:
+                if span_x0 > x0 + 0.5:
+                    break
+                font_name, font_size = span_font, span_size
+
+        elements.append(TextElement(text, x0, x1, top, bottom, page_num, font_name, font_size))
+
+    return PageData(
+        page_num=page_num,
+        width=page.rect.width,
+        height=page.rect.height,
+        elements=elements
+    )
+
+
+def _base_font_name(font_name: Optional[str]) -> Optional[str]:
+    """Strip a font subset prefix so both backends report the same name."""
+    return FONT_SUBSET_PREFIX_PATTERN.sub("", font_name) if font_name else font_name
+
+
+def _page_to_dict(page: PageData) -> dict:
+    """Convert one PageData to the dict layout used by to_dict()."""
+    return {
+        "page_num": page.page_num,
+        "width": page.width,
+        "height": page.height,
+        "elements": [
+            {
+                "text": elem.text,
+                "x0": elem.x0,
+                "x1": elem.x1,
+                "top": elem.top,
+                "bottom": elem.bottom,
+                "font_name": elem.font_name,
+                "font_size": elem.font_size
+            }
+            for elem in page.elements
+        ]
+    }
+
+
+def _extract_pymupdf_page_range(source: Union[str, bytes], start: int, end: int) -> list[PageData]:
+    """Process-pool worker: open the PDF and extract pages [start, end)."""
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    try:
+        return [_extract_pymupdf_page(doc.load_page(i), i) for i in range(start, end)]
+    finally:
+        doc.close()
+
+
+def _extract_pymupdf_parallel(source: Union[str, bytes], total_pages: int, workers: int) -> Iterator[PageData]:
+    """Split the document into one contiguous page range per worker."""
+    step = -(-total_pages // workers)
+    starts = range(0, total_pages, step)
+    ends = [min(start + step, total_pages) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+        for chunk in pool.map(_extract_pymupdf_page_range, repeat(source), starts, ends):
+            yield from chunk
+
+
 class PDFJsonExtractor:
-    """Extracts structured JSON data from PDFs using pdfplumber."""
+    """Extracts structured JSON data from PDFs using PyMuPDF or pdfplumber."""
 
-    def __init__(self):
-        """Initialize the extractor."""
-        pass
+    def __init__(self, backend: str = "pymupdf", max_workers: Optional[int] = 1):
+        """
+        Initialize the extractor.
 
-    def extract_page(self, page: "pdfplumber.page.Page", page_num: int) -> PageData:
+        Args:
+            backend: "pymupdf" (default, fastest) or "pdfplumber"
+            max_workers: Processes for PyMuPDF extraction of documents of
+                at least MIN_PAGES_FOR_POOL pages (1 = sequential, the
+                default; None = one per CPU). Opt in only for very long
+                documents on multi-core machines: results are pickled back
+                from the workers, which eats most of the gain on normal scripts
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+        self.backend = backend
+        self.max_workers = max_workers
+
+    def extract_page(self, page, page_num: int) -> PageData:
         """
         Extract data from a single page.
 
         Args:
-            page: pdfplumber page object
+            page: PyMuPDF or pdfplumber page object, matching the backend
             page_num: Page number (0-indexed)
 
         Returns:
             PageData object with extracted elements
         """
-        elements = []
+        if self.backend == "pymupdf":
+            return _extract_pymupdf_page(page, page_num)
+
+        if not page.chars:
+            return PageData(page_num=page_num, width=page.width, height=page.height, elements=[])
 
         words = page.extract_words(
             x_tolerance=3,
@@ -102,18 +234,14 @@ class PDFJsonExtractor:
             extra_attrs=["fontname", "size"]
         )
 
-        for word in words:
-            elem = TextElement(
-                text=word.get("text", ""),
-                x0=word.get("x0", 0),
-                x1=word.get("x1", 0),
-                top=word.get("top", 0),
-                bottom=word.get("bottom", 0),
-                page_num=page_num,
-                font_name=word.get("fontname"),
-                font_size=word.get("size")
+        # pdfplumber always sets the geometry keys; only the extra attrs can be missing
+        elements = [
+            TextElement(
+                word["text"], word["x0"], word["x1"], word["top"], word["bottom"],
+                page_num, _base_font_name(word.get("fontname")), word.get("size")
             )
-            elements.append(elem)
+            for word in words
+        ]
 
         return PageData(
             page_num=page_num,
@@ -122,50 +250,91 @@ class PDFJsonExtractor:
             elements=elements
         )
 
-    def extract(self, path: Union[str, Path, bytes]) -> Optional[PDFData]:
+    def iter_pages(self, path: Union[str, Path, bytes]) -> Iterator[PageData]:
         """
-        Extract structured data from a PDF.
+        Yield extracted pages one at a time.
+
+        Only the current page's elements are held in memory, so callers
+        that process pages independently never materialize the whole PDF.
 
         Args:
             path: Path to PDF file or PDF bytes
 
-        Returns:
-            PDFData object, or None if extraction failed
+        Yields:
+            PageData objects in page order
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ImportError: If the pdfplumber backend is not installed
         """
-        if not PDFPLUMBER_AVAILABLE:
-            logger.error("pdfplumber not available")
-            return None
-            
-        try:
+        if self.backend == "pdfplumber" and not PDFPLUMBER_AVAILABLE:
+            raise ImportError("pdfplumber not available")
+
+        if not isinstance(path, bytes):
+            path = Path(path)
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
+
+        if self.backend == "pymupdf":
+            if isinstance(path, bytes):
+                pdf = fitz.open(stream=path, filetype="pdf")
+            else:
+                pdf = fitz.open(str(path))
+
+            total_pages = len(pdf)
+            workers = min(self.max_workers or os.cpu_count() or 1, total_pages)
+            if total_pages >= MIN_PAGES_FOR_POOL and workers > 1:
+                pdf.close()
+                source = path if isinstance(path, bytes) else str(path)
+                yield from _extract_pymupdf_parallel(source, total_pages, workers)
+                return
+
+            try:
+                for i, page in enumerate(pdf):
+                    yield self.extract_page(page, i)
+            finally:
+                pdf.close()
+        else:
             if isinstance(path, bytes):
                 import io
                 pdf = pdfplumber.open(io.BytesIO(path))
-                file_path = Path("bytes_input.pdf")
             else:
-                path = Path(path)
-                if not path.exists():
-                    logger.error(f"File not found: {path}")
-                    return None
                 pdf = pdfplumber.open(path)
-                file_path = path
 
-            pages = []
-            for i, page in enumerate(pdf.pages):
-                page_data = self.extract_page(page, i)
-                pages.append(page_data)
+            try:
+                for i, page in enumerate(pdf.pages):
+                    yield self.extract_page(page, i)
+                    page.flush_cache()
+            finally:
+                pdf.close()
 
-            pdf.close()
+    def extract(self, path: Union[str, Path, bytes]) -> Optional[PDFData]:
+        """
+        Extract structured data from a PDF.
 
-            return PDFData(
-                path=file_path,
-                pages=pages,
-                total_pages=len(pages)
-            )
+        Args:
+            path: Path to PDF file or PDF bytes
+
+        Returns:
+            PDFData object, or None if extraction failed
+        """
+        file_path = Path("bytes_input.pdf") if isinstance(path, bytes) else Path(path)
 
+        try:
+            pages = list(self.iter_pages(path))
+        except (FileNotFoundError, ImportError) as e:
+            logger.error(str(e))
+            return None
         except Exception as e:
             logger.error(f"Error extracting PDF: {e}")
             return None
 
+        return PDFData(
+            path=file_path,
+            pages=pages,
+            total_pages=len(pages)
+        )
+
     def extract_lines(self, path: Union[str, Path, bytes]) -> list[dict]:
         """
         Extract lines of text with their positions.
@@ -178,34 +347,43 @@ class PDFJsonExtractor:
         Returns:
             List of line dicts with text and position info
         """
-        pdf_data = self.extract(path)
-        if not pdf_data:
+        lines = []
+        try:
+            for page in self.iter_pages(path):
+                lines.extend(self._page_lines(page))
+        except (FileNotFoundError, ImportError) as e:
+            logger.error(str(e))
             return []
+        except Exception as e:
+            logger.error(f"Error extracting PDF: {e}")
+            return []
+
+        return lines
 
+    def _page_lines(self, page: PageData) -> list[dict]:
+        """Group one page's words into line dicts, top to bottom."""
         lines = []
-        for page in pdf_data.pages:
-            y_groups = {}
-            for elem in page.elements:
-                y_key = round(elem.top / 5) * 5
-                if y_key not in y_groups:
-                    y_groups[y_key] = []
-                y_groups[y_key].append(elem)
-
-            for y_key in sorted(y_groups.keys()):
-                group = sorted(y_groups[y_key], key=lambda e: e.x0)
-                text = " ".join(e.text for e in group)
-
-                if text.strip():
-                    lines.append({
-                        "text": text,
-                        "page": page.page_num,
-                        "x0": min(e.x0 for e in group),
-                        "x1": max(e.x1 for e in group),
-                        "top": min(e.top for e in group),
-                        "bottom": max(e.bottom for e in group),
-                        "center_x": sum(e.center_x for e in group) / len(group),
-                        "page_width": page.width
-                    })
+        keyed = sorted(
+            ((round(elem.top / 5) * 5, elem.x0, elem) for elem in page.elements),
+            key=itemgetter(0, 1)
+        )
+
+        for _, entries in groupby(keyed, key=itemgetter(0)):
+            # Sorted by x0 within the line, so the first word has the minimum
+            group = [elem for _, _, elem in entries]
+            text = " ".join(e.text for e in group)
+
+            if text.strip():
+                lines.append({
+                    "text": text,
+                    "page": page.page_num,
+                    "x0": group[0].x0,
+                    "x1": max(e.x1 for e in group),
+                    "top": min(e.top for e in group),
+                    "bottom": max(e.bottom for e in group),
+                    "center_x": sum((e.x0 + e.x1) / 2 for e in group) / len(group),
+                    "page_width": page.width
+                })
 
         return lines
 
@@ -222,24 +400,25 @@ class PDFJsonExtractor:
         return {
             "path": str(pdf_data.path),
             "total_pages": pdf_data.total_pages,
-            "pages": [
-                {
-                    "page_num": page.page_num,
-                    "width": page.width,
-                    "height": page.height,
-                    "elements": [
-                        {
-                            "text": elem.text,
-                            "x0": elem.x0,
-                            "x1": elem.x1,
-                            "top": elem.top,
-                            "bottom": elem.bottom,
-                            "font_name": elem.font_name,
-                            "font_size": elem.font_size
-                        }
-                        for elem in page.elements
-                    ]
-                }
-                for page in pdf_data.pages
-            ]
+            "pages": [_page_to_dict(page) for page in pdf_data.pages]
         }
+
+    def write_json(self, pdf_data: PDFData, fp: BinaryIO) -> None:
+        """
+        Write PDFData as JSON to a binary file, one page at a time.
+
+        Produces the same document as to_dict() without building the
+        element dicts for every page at once.
+
+        Args:
+            pdf_data: PDFData object
+            fp: File object opened in binary mode
+        """
+        fp.write(b'{"path":' + json_dumps(str(pdf_data.path)))
+        fp.write(b',"total_pages":' + json_dumps(pdf_data.total_pages))
+        fp.write(b',"pages":[')
+        for i, page in enumerate(pdf_data.pages):
+            if i:
+                fp.write(b',')
+            fp.write(json_dumps(_page_to_dict(page)))
+        fp.write(b']}')
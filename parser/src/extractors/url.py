@@ -6,12 +6,26 @@ Supports both simple HTTP requests and headless browser rendering
 for JavaScript-heavy sites like Fandom wikis.
 """
 
+import atexit
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+import time
 import requests
+from pathlib import Path
 from typing import Optional
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
 JS_REQUIRED_PATTERNS = [
     "JavaScript is disabled",
     "Please enable JavaScript",
@@ -25,12 +39,129 @@ JS_REQUIRED_DOMAINS = [
     "wikia.com",
 ]
 
+# Fetched pages are cached on disk for a day; set NO_URL_CACHE=1 to bypass
+URL_CACHE_DIR = Path(os.getenv("URL_CACHE_DIR", "~/.scriptdle/url_cache")).expanduser()
+URL_CACHE_TTL = 24 * 60 * 60
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled session so repeat fetches from a host reuse connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _create_session()
+
+_playwright = None
+_browser = None
+_browser_lock = threading.Lock()
+
+
+def _get_browser():
+    """
+    Get the shared headless Chromium, launching it on first use.
+
+    The browser lives for the rest of the process and each fetch opens its
+    own context, so repeated fetches skip the Chromium start-up cost.
+    Playwright's sync API is bound to the thread that started it, so call
+    the browser fetchers from one thread.
+
+    Raises:
+        ImportError: If Playwright is not installed
+    """
+    global _playwright, _browser
+
+    with _browser_lock:
+        if _browser is None:
+            try:
+                from playwright.sync_api import sync_playwright
+            except ImportError:
+                raise ImportError(
+                    "Playwright is required for browser rendering. "
+                    "Install it with: pip install playwright && playwright install chromium"
+                )
+
+            _playwright = sync_playwright().start()
+            try:
+                _browser = _playwright.chromium.launch(headless=True)
+            except Exception:
+                # e.g. Chromium not installed: don't leave the driver running
+                _playwright.stop()
+                _playwright = None
+                raise
+            atexit.register(_close_browser)
+
+        return _browser
+
+
+def _close_browser() -> None:
+    """Shut down the shared browser and Playwright driver."""
+    global _playwright, _browser
+
+    with _browser_lock:
+        if _browser is not None:
+            _browser.close()
+            _browser = None
+        if _playwright is not None:
+            _playwright.stop()
+            _playwright = None
+
+
+def _cache_path(kind: str, url: str, headers: Optional[dict] = None) -> Path:
+    """Cache file for a URL, separate per fetch method and request headers."""
+    key = url
+    if headers:
+        # Header names are case-insensitive, so normalize before hashing
+        normalized = sorted((name.lower(), str(value).strip()) for name, value in headers.items())
+        key += "".join(f"\0{name}:{value}" for name, value in normalized)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return URL_CACHE_DIR / f"{kind}-{digest}.html"
+
+
+def _cache_enabled(use_cache: bool) -> bool:
+    return use_cache and not os.getenv("NO_URL_CACHE")
+
+
+def _read_cache(path: Path) -> Optional[str]:
+    """Return cached content if it exists and is younger than URL_CACHE_TTL."""
+    try:
+        if time.time() - path.stat().st_mtime < URL_CACHE_TTL:
+            logger.info(f"Using cached copy: {path}")
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def _write_cache(path: Path, content: str) -> None:
+    """Write content to the cache atomically; failures are only logged."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write URL cache {path}: {e}")
+
 
 def fetch_url(
     url: str,
     timeout: int = 30,
     headers: Optional[dict] = None,
     use_browser: Optional[bool] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Fetch HTML content from a URL.
@@ -44,6 +175,7 @@ def fetch_url(
         headers: Optional custom headers
         use_browser: Force browser rendering (True), force simple request (False),
                     or auto-detect (None, default)
+        use_cache: Reuse a copy fetched within URL_CACHE_TTL
 
     Returns:
         HTML content as string
@@ -55,13 +187,13 @@ def fetch_url(
         use_browser = any(domain in url for domain in JS_REQUIRED_DOMAINS)
 
     if use_browser:
-        return fetch_url_browser(url, timeout=timeout)
+        return fetch_url_browser(url, timeout=timeout, use_cache=use_cache)
 
-    html = fetch_url_simple(url, timeout=timeout, headers=headers)
+    html = fetch_url_simple(url, timeout=timeout, headers=headers, use_cache=use_cache)
 
     if any(pattern in html for pattern in JS_REQUIRED_PATTERNS):
         logger.info("Page requires JavaScript, falling back to browser rendering")
-        return fetch_url_browser(url, timeout=timeout)
+        return fetch_url_browser(url, timeout=timeout, use_cache=use_cache)
 
     return html
 
@@ -69,7 +201,8 @@ def fetch_url(
 def fetch_url_simple(
     url: str,
     timeout: int = 30,
-    headers: Optional[dict] = None
+    headers: Optional[dict] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Fetch HTML content using simple HTTP request.
@@ -78,6 +211,7 @@ def fetch_url_simple(
         url: URL to fetch
         timeout: Request timeout in seconds
         headers: Optional custom headers
+        use_cache: Reuse a copy fetched within URL_CACHE_TTL
 
     Returns:
         HTML content as string
@@ -86,19 +220,24 @@ def fetch_url_simple(
         requests.RequestException: If the request fails
     """
     if headers is None:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        headers = DEFAULT_HEADERS
+
+    cache_path = _cache_path("simple", url, headers)
+    if _cache_enabled(use_cache) and (cached := _read_cache(cache_path)) is not None:
+        return cached
 
     logger.info(f"Fetching URL (simple): {url}")
 
-    response = requests.get(url, timeout=timeout, headers=headers)
+    response = SESSION.get(url, timeout=timeout, headers=headers)
     response.raise_for_status()
 
     response.encoding = response.apparent_encoding or 'utf-8'
 
     logger.info(f"Fetched {len(response.text)} characters from {url}")
 
+    if _cache_enabled(use_cache):
+        _write_cache(cache_path, response.text)
+
     return response.text
 
 
@@ -106,6 +245,7 @@ def fetch_url_browser(
     url: str,
     timeout: int = 30,
     wait_for_selector: Optional[str] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Fetch HTML content using Playwright headless browser.
@@ -116,6 +256,7 @@ def fetch_url_browser(
         url: URL to fetch
         timeout: Page load timeout in seconds
         wait_for_selector: Optional CSS selector to wait for before extracting content
+        use_cache: Reuse a copy fetched within URL_CACHE_TTL
 
     Returns:
         HTML content as string
@@ -123,48 +264,47 @@ def fetch_url_browser(
     Raises:
         Exception: If browser rendering fails
     """
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        raise ImportError(
-            "Playwright is required for browser rendering. "
-            "Install it with: pip install playwright && playwright install chromium"
-        )
+    cache_path = _cache_path("browser", url)
+    if _cache_enabled(use_cache) and (cached := _read_cache(cache_path)) is not None:
+        return cached
 
     logger.info(f"Fetching URL (browser): {url}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        try:
-            page = browser.new_page()
-            page.set_default_timeout(timeout * 1000)
+    context = _get_browser().new_context()
+    try:
+        page = context.new_page()
+        page.set_default_timeout(timeout * 1000)
 
-            page.goto(url, wait_until="domcontentloaded")
+        page.goto(url, wait_until="domcontentloaded")
+
+        if wait_for_selector:
+            page.wait_for_selector(wait_for_selector, timeout=timeout * 1000)
+        else:
+            try:
+                page.wait_for_selector(
+                    ".mw-parser-output, .mw-content-text, #content, main",
+                    timeout=10000
+                )
+            except Exception:
+                page.wait_for_timeout(2000)
 
-            if wait_for_selector:
-                page.wait_for_selector(wait_for_selector, timeout=timeout * 1000)
-            else:
-                try:
-                    page.wait_for_selector(
-                        ".mw-parser-output, .mw-content-text, #content, main",
-                        timeout=10000
-                    )
-                except Exception:
-                    page.wait_for_timeout(2000)
+        html = page.content()
 
-            html = page.content()
+        logger.info(f"Fetched {len(html)} characters from {url} (browser)")
 
-            logger.info(f"Fetched {len(html)} characters from {url} (browser)")
+        if _cache_enabled(use_cache):
+            _write_cache(cache_path, html)
 
-            return html
+        return html
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 def fetch_wiki_content(
     url: str,
     timeout: int = 30,
+    use_cache: bool = True,
 ) -> str:
     """
     Fetch and extract main content from a wiki page.
@@ -175,6 +315,7 @@ def fetch_wiki_content(
     Args:
         url: Wiki page URL
         timeout: Page load timeout in seconds
+        use_cache: Reuse a copy fetched within URL_CACHE_TTL
 
     Returns:
         Extracted main content HTML
@@ -182,56 +323,55 @@ def fetch_wiki_content(
     Raises:
         Exception: If fetching or extraction fails
     """
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        raise ImportError(
-            "Playwright is required for wiki content extraction. "
-            "Install it with: pip install playwright && playwright install chromium"
-        )
+    cache_path = _cache_path("wiki", url)
+    if _cache_enabled(use_cache) and (cached := _read_cache(cache_path)) is not None:
+        return cached
 
     logger.info(f"Fetching wiki content: {url}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        try:
-            page = browser.new_page()
-            page.set_default_timeout(timeout * 1000)
+    context = _get_browser().new_context()
+    try:
+        page = context.new_page()
+        page.set_default_timeout(timeout * 1000)
 
-            page.goto(url, wait_until="domcontentloaded")
+        page.goto(url, wait_until="domcontentloaded")
 
-            try:
-                page.wait_for_selector(".mw-parser-output", timeout=10000)
-            except Exception:
-                page.wait_for_timeout(3000)
-
-            content = page.evaluate("""
-                () => {
-                    const content = document.querySelector('.mw-parser-output');
-                    if (!content) return null;
-
-                    const clone = content.cloneNode(true);
-
-                    const selectors = [
-                        '.toc', '.navbox', 'table', '.mw-editsection',
-                        '.reference', 'script', 'style',
-                        '[class*="cnx-"]', '[class*="ad-"]',
-                        '.portable-infobox', '.infobox'
-                    ];
-                    selectors.forEach(sel => {
-                        clone.querySelectorAll(sel).forEach(el => el.remove());
-                    });
-
-                    return clone.innerHTML;
-                }
-            """)
-
-            if content:
-                logger.info(f"Extracted {len(content)} characters of wiki content")
-                return content
-            else:
-                logger.warning("Could not extract wiki content, returning full page")
-                return page.content()
-
-        finally:
-            browser.close()
+        try:
+            page.wait_for_selector(".mw-parser-output", timeout=10000)
+        except Exception:
+            page.wait_for_timeout(3000)
+
+        content = page.evaluate("""
+            () => {
+                const content = document.querySelector('.mw-parser-output');
+                if (!content) return null;
+
+                const clone = content.cloneNode(true);
+
+                const selectors = [
+                    '.toc', '.navbox', 'table', '.mw-editsection',
+                    '.reference', 'script', 'style',
+                    '[class*="cnx-"]', '[class*="ad-"]',
+                    '.portable-infobox', '.infobox'
+                ];
+                selectors.forEach(sel => {
+                    clone.querySelectorAll(sel).forEach(el => el.remove());
+                });
+
+                return clone.innerHTML;
+            }
+        """)
+
+        if content:
+            logger.info(f"Extracted {len(content)} characters of wiki content")
+        else:
+            logger.warning("Could not extract wiki content, returning full page")
+            content = page.content()
+
+        if _cache_enabled(use_cache):
+            _write_cache(cache_path, content)
+
+        return content
+
+    finally:
+        context.close()
@@ -4,7 +4,7 @@ from .llm_vision import parse_pdf_vision
 from .llm_transcript import parse_transcript_llm, parse_transcript_pdf, parse_transcript_url
 
 # API client
-from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT
+from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT, get_client
 
 __all__ = [
     "parse_text_llm",
@@ -13,5 +13,6 @@ __all__ = [
     "parse_transcript_pdf",
     "parse_transcript_url",
     "GeminiClient",
+    "get_client",
     "SCRIPTDLE_SYSTEM_PROMPT",
 ]
@@ -1,6 +1,7 @@
 import os
 import logging
 import time
+from functools import lru_cache
 from typing import Optional
 
 from google import genai
@@ -102,6 +103,12 @@ class GeminiClient:
                 raise
 
 
+@lru_cache(maxsize=8)
+def get_client(api_key: Optional[str] = None, model_name: str = "gemini-2.0-flash") -> GeminiClient:
+    """Get a shared GeminiClient so repeated parses reuse its connections."""
+    return GeminiClient(api_key=api_key, model_name=model_name)
+
+
 SCRIPTDLE_SYSTEM_PROMPT = """You are an expert screenplay parser. Extract all dialogue as a flat list for the Scriptdle game format.
 
 You must output valid JSON that follows this exact schema:
@@ -0,0 +1,119 @@
+"""
+LLM Response Cache
+
+Content-addressed on-disk cache of raw LLM responses. Keys hash everything
+that determines a response (model, system prompt, prompt, attached data and
+generation settings), so re-parsing identical input skips the API call.
+Merged parse results are stored the same way, keyed on the whole input.
+
+Entries expire after LLM_CACHE_TTL. Set NO_LLM_CACHE=1 (or pass --no-cache
+to main.py) to bypass the cache; to clear it, delete LLM_CACHE_DIR.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from ..schema import Scriptdle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "~/.scriptdle/llm_cache")
+LLM_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Bump when prompts, response handling or the cached formats change, so
+# entries written by older code are never read back
+CACHE_VERSION = 1
+
+# Bump when the Scriptdle schema or the way chunk results are merged changes;
+# callers include it in result keys so stale merged results are not reused
+RESULT_SCHEMA_VERSION = 1
+
+
+def llm_cache_enabled(use_cache: bool) -> bool:
+    return use_cache and not os.getenv("NO_LLM_CACHE")
+
+
+class LLMCache:
+    """Stores responses as <dir>/<hash[:2]>/<hash>.json."""
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        system_prompt: str,
+        prompt: str,
+        data: bytes = b"",
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+    ) -> str:
+        """
+        Build a cache key for one LLM call.
+
+        Args:
+            model_name: Gemini model name
+            system_prompt: System instruction sent with the call
+            prompt: User prompt
+            data: Attached file bytes (e.g. a PDF chunk), if any
+            temperature: Sampling temperature
+            max_tokens: Output token limit
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        h = hashlib.sha256()
+        for part in (f"v{CACHE_VERSION}", model_name, system_prompt, prompt, f"{temperature}:{max_tokens}"):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(data)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss or expired entry."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime < LLM_CACHE_TTL:
+                return path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response atomically; failures are logged, not raised."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(response)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry {path}: {e}")
+
+    def get_result(self, key: str) -> Optional[Scriptdle]:
+        """Return a cached parse result for key, or None on a miss or unreadable entry."""
+        cached = self.get(key)
+        if cached is None:
+            return None
+        try:
+            return Scriptdle.model_validate_json(cached)
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid cached result {key}: {e}")
+            return None
+
+    def set_result(self, key: str, result: Scriptdle) -> None:
+        """Store a parse result; failures are logged, not raised."""
+        self.set(key, result.model_dump_json())
@@ -9,14 +9,21 @@ import json
 import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 
 from ..schema import Scriptdle, DialogueLine
-from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT
+from ..utils.json_utils import json_loads
+from ..utils.text_cleaning import slugify
+from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT, get_client
 
 logger = logging.getLogger(__name__)
 
+JSON_FENCE_PATTERN = re.compile(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)')
+JSON_TOKEN_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(")?|[{}\[\],]')
+JSON_CLOSERS = {'{': '}', '[': ']'}
+
 
 def parse_text_llm(
     text: str,
@@ -29,6 +36,7 @@ def parse_text_llm(
     max_chunks: int = 0,
     verbose: bool = False,
     model_name: str = "gemini-2.0-flash",
+    max_workers: int = 4,
 ) -> Scriptdle:
     """
     Parse screenplay text using Gemini LLM into scriptdle format.
@@ -47,12 +55,13 @@ def parse_text_llm(
         max_chunks: Maximum chunks to process (0 = all)
         verbose: Print progress output
         model_name: Name of Gemini model to use
+        max_workers: Chunks sent to the LLM concurrently
 
     Returns:
         Scriptdle object
     """
     start_time = time.time()
-    client = GeminiClient(model_name=model_name)
+    client = get_client(model_name=model_name)
 
     if verbose:
         print(f"[llm_text] Starting with {len(text)} chars...", flush=True)
@@ -70,52 +79,41 @@ def parse_text_llm(
     all_characters: set[str] = set()
     detected_title = ""
 
-    for i, chunk in enumerate(chunks):
-        if verbose:
-            print(f"[llm_text] Chunk {i+1}/{len(chunks)} ({len(chunk)} chars)...", flush=True)
-
-        prompt = _build_prompt(chunk, i, len(chunks))
-
-        try:
-            call_start = time.time()
-            response = client.generate(
-                prompt=prompt,
-                system_instruction=SCRIPTDLE_SYSTEM_PROMPT,
-                max_tokens=8192,
-                temperature=0.1
-            )
-            call_time = time.time() - call_start
-
-            if verbose:
-                print(f"[llm_text] Chunk {i+1} took {call_time:.2f}s", flush=True)
+    total = len(chunks)
+    workers = max(1, min(max_workers, total))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_process_chunk, client, chunk, i, total, verbose)
+            for i, chunk in enumerate(chunks)
+        ]
+        results = [future.result() for future in futures]
+
+    previous_lines: List[DialogueLine] = []
+    for result in results:
+        if not result:
+            previous_lines = []
+            continue
 
-            data = _parse_json_response(response)
-            if data:
-                lines, chars = _convert_scriptdle_data(data)
-                if verbose:
-                    print(f"[llm_text] Chunk {i+1}: {len(lines)} lines, {len(chars)} chars", flush=True)
+        lines, chars, chunk_title = result
 
-                all_lines.extend(lines)
-                all_characters.update(chars)
+        # Chunks overlap, so a chunk can open with the previous chunk's last lines
+        skip = _count_overlap_lines(previous_lines, lines, overlap)
+        if verbose and skip:
+            print(f"[llm_text] Dropped {skip} lines repeated from chunk overlap", flush=True)
 
-                if not detected_title and data.get("title"):
-                    detected_title = data["title"]
-            else:
-                if verbose:
-                    print(f"[llm_text] Chunk {i+1} failed to parse JSON", flush=True)
+        all_lines.extend(lines[skip:])
+        previous_lines = lines
+        all_characters.update(chars)
 
-        except Exception as e:
-            if verbose:
-                print(f"[llm_text] Chunk {i+1} ERROR: {e}", flush=True)
-            logger.error(f"Error processing chunk {i+1}: {e}")
-            continue
+        if not detected_title and chunk_title:
+            detected_title = chunk_title
 
     elapsed = time.time() - start_time
     if verbose:
         print(f"[llm_text] Done in {elapsed:.2f}s - {len(all_lines)} lines", flush=True)
 
     if not movie_id and (title or detected_title):
-        movie_id = _slugify(title or detected_title)
+        movie_id = slugify(title or detected_title)
 
     return Scriptdle(
         id=movie_id,
@@ -126,6 +124,75 @@ def parse_text_llm(
     )
 
 
+def _process_chunk(
+    client: GeminiClient,
+    chunk: str,
+    i: int,
+    total_chunks: int,
+    verbose: bool,
+) -> Optional[Tuple[List[DialogueLine], set[str], Optional[str]]]:
+    """Send one chunk to the LLM; returns (lines, characters, title) or None on failure."""
+    if verbose:
+        print(f"[llm_text] Chunk {i+1}/{total_chunks} ({len(chunk)} chars)...", flush=True)
+
+    prompt = _build_prompt(chunk, i, total_chunks)
+
+    try:
+        call_start = time.time()
+        response = client.generate(
+            prompt=prompt,
+            system_instruction=SCRIPTDLE_SYSTEM_PROMPT,
+            max_tokens=8192,
+            temperature=0.1
+        )
+        call_time = time.time() - call_start
+
+        if verbose:
+            print(f"[llm_text] Chunk {i+1} took {call_time:.2f}s", flush=True)
+
+        data = _parse_json_response(response)
+        if not data:
+            if verbose:
+                print(f"[llm_text] Chunk {i+1} failed to parse JSON", flush=True)
+            return None
+
+        lines, chars = _convert_scriptdle_data(data)
+        if verbose:
+            print(f"[llm_text] Chunk {i+1}: {len(lines)} lines, {len(chars)} chars", flush=True)
+        return lines, chars, data.get("title")
+
+    except Exception as e:
+        if verbose:
+            print(f"[llm_text] Chunk {i+1} ERROR: {e}", flush=True)
+        logger.error(f"Error processing chunk {i+1}: {e}")
+        return None
+
+
+def _count_overlap_lines(previous: List[DialogueLine], lines: List[DialogueLine], overlap: int) -> int:
+    """
+    Count the leading lines of a chunk that repeat the end of the previous one.
+
+    Only the previous chunk's trailing lines whose text fits in `overlap`
+    characters are considered, and the longest run of them that matches the
+    start of `lines` line for line wins, so a line that merely recurs in the
+    script is never dropped.
+    """
+    tail: List[Tuple[str, str]] = []
+    size = 0
+    for line in reversed(previous):
+        size += len(line.text)
+        if size > overlap:
+            break
+        tail.append((line.character, line.text))
+    tail.reverse()
+
+    head = [(line.character, line.text) for line in lines[:len(tail)]]
+    for count in range(len(head), 0, -1):
+        if tail[-count:] == head[:count]:
+            return count
+    return 0
+
+
 def _chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
     """Split text into overlapping chunks, breaking at natural boundaries."""
     if len(text) <= chunk_size:
@@ -141,16 +208,13 @@ def _chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
         if end_pos < len(text):
             search_window = min(500, chunk_size // 4)
             search_start = max(end_pos - search_window, current_pos + min_chunk)
-            search_text = text[search_start:end_pos]
 
-            scene_match = None
-            for match in re.finditer(r'\n\s*(INT\.|EXT\.)', search_text):
-                scene_match = match
+            scene_break = _find_last_scene_break(text, search_start, end_pos)
 
-            if scene_match:
-                end_pos = search_start + scene_match.start()
-            elif (last_para := search_text.rfind("\n\n")) > 0:
-                end_pos = search_start + last_para
+            if scene_break >= 0:
+                end_pos = scene_break
+            elif (last_para := text.rfind("\n\n", search_start, end_pos)) > search_start:
+                end_pos = last_para
 
         chunk = text[current_pos:end_pos].strip()
         if chunk:
@@ -163,6 +227,33 @@ def _chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
     return chunks
 
 
+def _find_last_scene_break(text: str, start: int, end: int) -> int:
+    """
+    Find where the last INT./EXT. heading's line break starts in text[start:end].
+
+    Searches backwards for the keyword instead of scanning every regex
+    hit, then requires a newline somewhere in the whitespace run before
+    it (headings are often indented in layout text).
+
+    Returns:
+        Index into text of the first newline in that run, or -1 if there
+        is no heading in the window
+    """
+    while True:
+        idx = max(text.rfind("INT.", start, end), text.rfind("EXT.", start, end))
+        if idx < 0:
+            return -1
+
+        run_start = idx
+        while run_start > start and text[run_start - 1].isspace():
+            run_start -= 1
+
+        newline = text.find("\n", run_start, idx)
+        if newline >= 0:
+            return newline
+        end = idx + 3
+
+
 def _build_prompt(chunk: str, chunk_idx: int, total_chunks: int) -> str:
     """Build the LLM prompt for a chunk."""
     if chunk_idx == 0:
@@ -185,56 +276,66 @@ JSON output:"""
 def _parse_json_response(response: str) -> Optional[dict]:
     """Parse JSON from LLM response, handling various formats."""
     try:
-        return json.loads(response)
+        return json_loads(response)
     except json.JSONDecodeError:
         pass
 
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)', response)
-    if json_match:
-        json_text = json_match.group(1).strip()
-        try:
-            return json.loads(json_text)
-        except json.JSONDecodeError:
-            repaired = _repair_json(json_text)
-            if repaired:
-                return repaired
+    json_text = response
+    json_match = JSON_FENCE_PATTERN.search(response)
+    if json_match and '{' in json_match.group(1):
+        json_text = json_match.group(1)
 
-    start = response.find('{')
-    if start >= 0:
-        json_text = response[start:]
+    balanced = _find_balanced_json(json_text)
+    if balanced:
         try:
-            return json.loads(json_text)
+            return json_loads(balanced)
         except json.JSONDecodeError:
-            repaired = _repair_json(json_text)
-            if repaired:
-                return repaired
+            pass
 
     logger.error(f"Failed to parse JSON: {response[:200]}...")
     return None
 
 
-def _repair_json(json_text: str) -> Optional[dict]:
-    """Try to repair truncated JSON by adding missing brackets."""
-    open_braces = json_text.count('{')
-    close_braces = json_text.count('}')
-    open_brackets = json_text.count('[')
-    close_brackets = json_text.count(']')
-
-    if open_braces > close_braces or open_brackets > close_brackets:
-        last_comma = json_text.rfind(',')
-        if last_comma > 0:
-            json_text = json_text[:last_comma]
+def _find_balanced_json(json_text: str) -> Optional[str]:
+    """
+    Find the JSON object starting at the first '{' in a single scan.
 
-        needed_brackets = ']' * (open_brackets - close_brackets)
-        needed_braces = '}' * (open_braces - close_braces)
-        repaired = json_text + needed_brackets + needed_braces
+    Brackets inside strings are skipped. If the object closes, trailing
+    text is dropped; if it was truncated, it is cut back to the last
+    complete element and the still-open brackets are closed in order.
 
-        try:
-            return json.loads(repaired)
-        except json.JSONDecodeError:
-            pass
-
-    return None
+    Returns:
+        JSON text to parse, or None if no object could be recovered
+    """
+    start = json_text.find('{')
+    if start < 0:
+        return None
+
+    stack = []
+    safe_end, safe_closers = None, ""
+
+    for match in JSON_TOKEN_PATTERN.finditer(json_text, start):
+        token = match.group()
+
+        if token[0] == '"':
+            if match.group(1) is None:
+                break
+        elif token == ',':
+            safe_end, safe_closers = match.start(), "".join(reversed(stack))
+        elif token in JSON_CLOSERS:
+            stack.append(JSON_CLOSERS[token])
+            safe_end, safe_closers = match.end(), "".join(reversed(stack))
+        else:
+            if not stack or stack[-1] != token:
+                break
+            stack.pop()
+            if not stack:
+                return json_text[start:match.end()]
+            safe_end, safe_closers = match.end(), "".join(reversed(stack))
+
+    if safe_end is None:
+        return None
+    return json_text[start:safe_end] + safe_closers
 
 
 def _convert_scriptdle_data(data: dict) -> Tuple[List[DialogueLine], set[str]]:
@@ -265,13 +366,3 @@ def _convert_scriptdle_data(data: dict) -> Tuple[List[DialogueLine], set[str]]:
             characters.add(char.strip().upper())
 
     return lines, characters
-
-
-def _slugify(text: str) -> str:
-    """Convert text to a URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    text = text.strip('-')
-    return text
@@ -8,15 +8,26 @@ import json
 import logging
 import time
 import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any, List, Tuple
 from pathlib import Path
 
-from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT
+from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT, get_client
+from .llm_cache import LLMCache, RESULT_SCHEMA_VERSION, llm_cache_enabled
 from ..extractors import extract_simple, extract_wiki, fetch_url
 from ..schema import Scriptdle, DialogueLine
+from ..utils.json_utils import json_loads
+from ..utils.text_cleaning import slugify
 
 logger = logging.getLogger(__name__)
 
+# A line whose CRC has these bits clear ends a chunk (~1 in 64 lines)
+CHUNK_BOUNDARY_MASK = 0x3F
+
+JSON_FENCE_PATTERN = re.compile(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)')
+JSON_DECODER = json.JSONDecoder()
+
 def parse_transcript_url(
     url: str,
     movie_id: str = "",
@@ -24,6 +35,7 @@ def parse_transcript_url(
     year: Optional[int] = None,
     model_name: str = "gemini-2.0-flash",
     verbose: bool = False,
+    use_cache: bool = True,
 ) -> Optional[Scriptdle]:
     """
     Fetch URL, extract wiki content, and parse as scriptdle format.
@@ -35,6 +47,7 @@ def parse_transcript_url(
         year: Release year
         model_name: Gemini model to use
         verbose: Enable verbose output
+        use_cache: Reuse cached page fetches and LLM responses
 
     Returns:
         Scriptdle object or None if parsing fails
@@ -43,7 +56,7 @@ def parse_transcript_url(
         print(f"[llm_transcript] Fetching URL: {url}", flush=True)
 
     try:
-        html = fetch_url(url)
+        html = fetch_url(url, use_cache=use_cache)
     except Exception as e:
         logger.error(f"Failed to fetch URL {url}: {e}")
         return None
@@ -63,7 +76,8 @@ def parse_transcript_url(
         title=title,
         year=year,
         verbose=verbose,
-        model_name=model_name
+        model_name=model_name,
+        use_cache=use_cache
     )
 
 
@@ -74,6 +88,7 @@ def parse_transcript_pdf(
     year: Optional[int] = None,
     model_name: str = "gemini-2.0-flash",
     verbose: bool = False,
+    use_cache: bool = True,
 ) -> Optional[Scriptdle]:
     """
     Extract text from PDF and parse it as a scriptdle format.
@@ -94,7 +109,8 @@ def parse_transcript_pdf(
         title=title,
         year=year,
         verbose=verbose,
-        model_name=model_name
+        model_name=model_name,
+        use_cache=use_cache
     )
 
 def parse_transcript_llm(
@@ -107,51 +123,75 @@ def parse_transcript_llm(
     overlap: int = 500,
     verbose: bool = False,
     model_name: str = "gemini-2.0-flash",
+    use_cache: bool = True,
+    max_workers: int = 4,
 ) -> Scriptdle:
     """
     Parse transcript text into scriptdle format using Gemini.
 
+    With use_cache, raw responses are stored in an LLMCache so re-parsing
+    unchanged chunks skips the API call, and the merged result of a fully
+    parsed transcript is stored too so re-parsing the same text skips
+    chunking altogether. Up to max_workers chunks are sent to the LLM
+    concurrently; results are merged in chunk order.
+
     Returns:
         Scriptdle object with flat dialogue lines
     """
     start_time = time.time()
-    client = GeminiClient(model_name=model_name)
+    client = get_client(model_name=model_name)
+    cache = LLMCache() if llm_cache_enabled(use_cache) else None
 
     if verbose:
         print(f"[llm_transcript] Starting with {len(text)} chars...", flush=True)
 
-    chunks: List[str] = []
-    for i in range(0, len(text), chunk_size - overlap):
-        chunks.append(text[i:i + chunk_size])
-
     all_lines: List[DialogueLine] = []
     all_characters: set[str] = set()
     detected_title: str = ""
 
-    for i, chunk in enumerate(chunks):
-        if verbose:
-            print(f"[llm_transcript] Chunk {i+1}/{len(chunks)}...", flush=True)
-
-        prompt = f"Parse this transcript chunk. Extract all dialogue lines.\n\nText:\n{chunk}\n\nJSON output:"
-
-        try:
-            response = client.generate(
-                prompt=prompt,
-                system_instruction=SCRIPTDLE_SYSTEM_PROMPT,
-                max_tokens=8192,
-                temperature=0.1
-            )
-
-            data = _parse_json_response(response)
-            if data:
-                chunk_lines, chunk_chars = _convert_scriptdle_data(data)
-                all_lines.extend(chunk_lines)
-                all_characters.update(chunk_chars)
-                if not detected_title and data.get("title"):
-                    detected_title = data["title"]
+    result_key = LLMCache.make_key(
+        model_name,
+        SCRIPTDLE_SYSTEM_PROMPT,
+        f"transcript:r{RESULT_SCHEMA_VERSION}:{chunk_size}:{overlap}",
+        text.encode("utf-8"),
+    )
+    cached_result = cache.get_result(result_key) if cache else None
 
-        except Exception as e:
-            logger.error(f"Error parsing transcript chunk {i+1}: {e}")
+    if cached_result:
+        all_lines = cached_result.lines
+        all_characters = set(cached_result.characters)
+        detected_title = cached_result.title
+        if verbose:
+            print("[llm_transcript] Loaded parsed transcript from cache", flush=True)
+    else:
+        chunks = _chunk_transcript(text, chunk_size, overlap)
+
+        total = len(chunks)
+        workers = max(1, min(max_workers, total))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_process_chunk, client, cache, model_name, chunk, i, total, verbose)
+                for i, chunk in enumerate(chunks)
+            ]
+            results = [future.result() for future in futures]
+
+        for result in results:
+            if not result:
+                continue
+
+            chunk_lines, chunk_chars, chunk_title = result
+            all_lines.extend(chunk_lines)
+            all_characters.update(chunk_chars)
+            if not detected_title and chunk_title:
+                detected_title = chunk_title
+
+        # A failed chunk may succeed on a later run, so only complete parses are stored
+        if cache and all(results):
+            cache.set_result(result_key, Scriptdle(
+                title=detected_title,
+                characters=sorted(all_characters),
+                lines=all_lines
+            ))
 
     elapsed = time.time() - start_time
 
@@ -159,30 +199,121 @@ def parse_transcript_llm(
         print(f"[llm_transcript] Parsed {len(all_lines)} lines in {elapsed:.2f}s", flush=True)
 
     if not movie_id and (title or detected_title):
-        movie_id = _slugify(title or detected_title)
+        movie_id = slugify(title or detected_title)
 
     return Scriptdle(
         id=movie_id,
         title=title or detected_title or "Transcript",
         year=year,
-        characters=sorted(list(all_characters)),
+        characters=sorted(all_characters),
         lines=all_lines
     )
 
+def _process_chunk(
+    client: GeminiClient,
+    cache: Optional[LLMCache],
+    model_name: str,
+    chunk: str,
+    i: int,
+    total_chunks: int,
+    verbose: bool,
+) -> Optional[Tuple[List[DialogueLine], set[str], Optional[str]]]:
+    """Parse one transcript chunk; returns (lines, characters, title) or None on failure."""
+    if verbose:
+        print(f"[llm_transcript] Chunk {i+1}/{total_chunks}...", flush=True)
+
+    prompt = f"Parse this transcript chunk. Extract all dialogue lines.\n\nText:\n{chunk}\n\nJSON output:"
+
+    try:
+        cache_key = LLMCache.make_key(model_name, SCRIPTDLE_SYSTEM_PROMPT, prompt)
+        cached = cache.get(cache_key) if cache else None
+
+        if cached is None:
+            response = client.generate(
+                prompt=prompt,
+                system_instruction=SCRIPTDLE_SYSTEM_PROMPT,
+                max_tokens=8192,
+                temperature=0.1
+            )
+        else:
+            response = cached
+
+        data = _parse_json_response(response)
+        if not data:
+            return None
+
+        if cache and cached is None:
+            cache.set(cache_key, response)
+        chunk_lines, chunk_chars = _convert_scriptdle_data(data)
+        return chunk_lines, chunk_chars, data.get("title")
+
+    except Exception as e:
+        logger.error(f"Error parsing transcript chunk {i+1}: {e}")
+        return None
+
+
+def _chunk_transcript(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """
+    Split text into chunks at content-defined line boundaries.
+
+    A chunk ends after a line whose CRC matches CHUNK_BOUNDARY_MASK once it
+    holds at least chunk_size // 2 characters, and is forced to end before
+    exceeding chunk_size * 4 // 3. Boundaries depend only on nearby lines, so
+    an edit early in a transcript leaves later chunks (and their cached LLM
+    responses) unchanged. Each chunk after the first repeats up to `overlap`
+    characters of whole lines from the end of the previous one.
+    """
+    min_chunk = chunk_size // 2
+    max_chunk = chunk_size * 4 // 3
+
+    lines: List[str] = []
+    for line in text.splitlines(keepends=True):
+        if len(line) > max_chunk:
+            lines.extend(line[i:i + max_chunk] for i in range(0, len(line), max_chunk))
+        else:
+            lines.append(line)
+
+    chunks: List[str] = []
+    start = 0      # first line of the current chunk, including overlap
+    fresh = 0      # first line not already sent in an earlier chunk
+    size = 0
+    at_boundary = False
+
+    for i, line in enumerate(lines):
+        if i > fresh and (at_boundary or size + len(line) > max_chunk):
+            chunks.append("".join(lines[start:i]))
+            prev_start, start, fresh, size = start, i, i, 0
+            while start - 1 > prev_start and size + len(lines[start - 1]) <= overlap:
+                start -= 1
+                size += len(lines[start])
+
+        size += len(line)
+        at_boundary = (
+            size >= min_chunk
+            and not zlib.crc32(line.encode("utf-8")) & CHUNK_BOUNDARY_MASK
+        )
+
+    if fresh < len(lines):
+        chunks.append("".join(lines[start:]))
+
+    return chunks
+
+
 def _parse_json_response(response: str) -> Optional[dict[str, Any]]:
     """Helper to extract JSON from LLM response."""
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)', response)
+    json_match = JSON_FENCE_PATTERN.search(response)
     if json_match:
         try:
-            return json.loads(json_match.group(1).strip())
-        except:
+            return json_loads(json_match.group(1).strip())
+        except json.JSONDecodeError:
             pass
-            
+
+    # raw_decode stops at the end of the object instead of failing on trailing prose
     start = response.find('{')
     if start >= 0:
         try:
-            return json.loads(response[start:])
-        except Exception:
+            return JSON_DECODER.raw_decode(response, start)[0]
+        except json.JSONDecodeError:
             pass
     return None
 
@@ -195,23 +326,10 @@ def _convert_scriptdle_data(data: dict) -> Tuple[List[DialogueLine], set[str]]:
 
     for item in line_data:
         char = (item.get("character") or "").strip().upper()
-        text = (item.get("text") or item.get("content") or "").strip()
-
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join((item.get("text") or item.get("content") or "").split())
 
         if char and text:
             characters.add(char)
             lines.append(DialogueLine(character=char, text=text))
 
     return lines, characters
-
-
-def _slugify(text: str) -> str:
-    """Convert text to a URL-friendly slug."""
-    import re
-    text = text.lower()
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    text = text.strip('-')
-    return text
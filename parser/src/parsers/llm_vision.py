@@ -9,15 +9,24 @@ import json
 import re
 import time
 import logging
-from typing import Optional, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, Optional, List, Tuple
 
 import fitz
 
 from ..schema import Scriptdle, DialogueLine
-from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT
+from ..utils.json_utils import json_loads
+from ..utils.text_cleaning import slugify
+from .gemini_client import GeminiClient, SCRIPTDLE_SYSTEM_PROMPT, get_client
+from .llm_cache import LLMCache, RESULT_SCHEMA_VERSION, llm_cache_enabled
 
 logger = logging.getLogger(__name__)
 
+JSON_FENCE_PATTERN = re.compile(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)')
+JSON_DECODER = json.JSONDecoder()
+
 
 def parse_pdf_vision(
     pdf_bytes: bytes,
@@ -29,6 +38,8 @@ def parse_pdf_vision(
     max_chunks: int = 0,
     verbose: bool = False,
     model_name: str = "gemini-2.0-flash",
+    use_cache: bool = True,
+    max_workers: int = 4,
 ) -> Scriptdle:
     """
     Parse PDF directly using Gemini's vision capabilities into scriptdle format.
@@ -46,36 +57,124 @@ def parse_pdf_vision(
         max_chunks: Maximum chunks to process (0 = all)
         verbose: Print progress output
         model_name: Name of Gemini model to use
+        use_cache: Reuse stored responses for identical page chunks, and the
+            merged result for an identical PDF
+        max_workers: Chunks sent to the LLM concurrently
 
     Returns:
         Scriptdle object
     """
     start_time = time.time()
-    client = GeminiClient(model_name=model_name)
+    client = get_client(model_name=model_name)
+    cache = LLMCache() if llm_cache_enabled(use_cache) else None
 
     if verbose:
         print(f"[llm_vision] Starting PDF vision parsing...", flush=True)
 
-    chunks = _split_pdf_pages(pdf_bytes, pages_per_chunk)
-    if verbose:
-        print(f"[llm_vision] Split into {len(chunks)} chunks ({pages_per_chunk} pages each)", flush=True)
-
-    if max_chunks > 0:
-        chunks = chunks[:max_chunks]
-        if verbose:
-            print(f"[llm_vision] Limited to {max_chunks} chunks", flush=True)
-
     all_lines: List[DialogueLine] = []
     all_characters: set[str] = set()
     detected_title = ""
 
-    for i, chunk_bytes in enumerate(chunks):
+    result_key = LLMCache.make_key(
+        model_name,
+        SCRIPTDLE_SYSTEM_PROMPT,
+        f"vision:r{RESULT_SCHEMA_VERSION}:{pages_per_chunk}:{max_chunks}",
+        pdf_bytes,
+    )
+    cached_result = cache.get_result(result_key) if cache else None
+
+    if cached_result:
+        all_lines = cached_result.lines
+        all_characters = set(cached_result.characters)
+        detected_title = cached_result.title
         if verbose:
-            print(f"[llm_vision] Chunk {i+1}/{len(chunks)}...", flush=True)
+            print("[llm_vision] Loaded parsed PDF from cache", flush=True)
+    else:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            total_pages = len(doc)
+        total = max(1, -(-total_pages // pages_per_chunk))
+        if verbose:
+            print(f"[llm_vision] Split into {total} chunks ({pages_per_chunk} pages each)", flush=True)
 
-        prompt = _build_vision_prompt(i, len(chunks), pages_per_chunk)
+        chunks = _split_pdf_pages(pdf_bytes, pages_per_chunk)
+        if max_chunks > 0:
+            chunks = islice(chunks, max_chunks)
+            total = min(total, max_chunks)
+            if verbose:
+                print(f"[llm_vision] Limited to {max_chunks} chunks", flush=True)
+
+        # Only submit a chunk once a worker is about to free up, so at most
+        # `workers` serialized chunks are alive at a time.
+        workers = max(1, min(max_workers, total))
+        results = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i, chunk_bytes in enumerate(chunks):
+                if len(pending) >= workers:
+                    results.append(pending.popleft().result())
+                pending.append(pool.submit(
+                    _process_chunk, client, cache, model_name, chunk_bytes,
+                    i, total, pages_per_chunk, verbose
+                ))
+            results.extend(future.result() for future in pending)
+
+        for result in results:
+            if not result:
+                continue
+
+            lines, chars, chunk_title = result
+            all_lines.extend(lines)
+            all_characters.update(chars)
+
+            if not detected_title and chunk_title:
+                detected_title = chunk_title
+
+        # A failed chunk may succeed on a later run, so only complete parses are stored
+        if cache and all(results):
+            cache.set_result(result_key, Scriptdle(
+                title=detected_title,
+                characters=sorted(all_characters),
+                lines=all_lines
+            ))
 
-        try:
+    elapsed = time.time() - start_time
+    if verbose:
+        print(f"[llm_vision] Done in {elapsed:.2f}s - {len(all_lines)} lines", flush=True)
+
+    if not movie_id and (title or detected_title):
+        movie_id = slugify(title or detected_title)
+
+    return Scriptdle(
+        id=movie_id,
+        title=title or detected_title or source_file,
+        year=year,
+        characters=sorted(all_characters),
+        lines=all_lines
+    )
+
+
+def _process_chunk(
+    client: GeminiClient,
+    cache: Optional[LLMCache],
+    model_name: str,
+    chunk_bytes: bytes,
+    i: int,
+    total_chunks: int,
+    pages_per_chunk: int,
+    verbose: bool,
+) -> Optional[Tuple[List[DialogueLine], set[str], Optional[str]]]:
+    """Send one page chunk to the LLM; returns (lines, characters, title) or None on failure."""
+    if verbose:
+        print(f"[llm_vision] Chunk {i+1}/{total_chunks}...", flush=True)
+
+    # Keyed prompt must not depend on total_chunks (it changes with max_chunks)
+    prompt = _build_vision_prompt(i, pages_per_chunk)
+
+    try:
+        cache_key = LLMCache.make_key(model_name, SCRIPTDLE_SYSTEM_PROMPT, prompt, chunk_bytes)
+        cached = cache.get(cache_key) if cache else None
+
+        if cached is None:
             call_start = time.time()
             response = client.generate_with_image(
                 prompt=prompt,
@@ -89,69 +188,57 @@ def parse_pdf_vision(
 
             if verbose:
                 print(f"[llm_vision] Chunk {i+1} took {call_time:.2f}s", flush=True)
-
-            data = _parse_json_response(response)
-            if data:
-                lines, chars = _convert_scriptdle_data(data)
-                if verbose:
-                    print(f"[llm_vision] Chunk {i+1}: {len(lines)} lines, {len(chars)} chars", flush=True)
-
-                all_lines.extend(lines)
-                all_characters.update(chars)
-
-                if not detected_title and data.get("title"):
-                    detected_title = data["title"]
-            else:
-                if verbose:
-                    print(f"[llm_vision] Chunk {i+1} failed to parse JSON", flush=True)
-
-        except Exception as e:
+        else:
+            response = cached
             if verbose:
-                print(f"[llm_vision] Chunk {i+1} ERROR: {e}", flush=True)
-            logger.error(f"Error processing chunk {i+1}: {e}")
-            continue
+                print(f"[llm_vision] Chunk {i+1} loaded from cache", flush=True)
 
-    elapsed = time.time() - start_time
-    if verbose:
-        print(f"[llm_vision] Done in {elapsed:.2f}s - {len(all_lines)} lines", flush=True)
+        data = _parse_json_response(response)
+        if not data:
+            if verbose:
+                print(f"[llm_vision] Chunk {i+1} failed to parse JSON", flush=True)
+            return None
 
-    if not movie_id and (title or detected_title):
-        movie_id = _slugify(title or detected_title)
+        if cache and cached is None:
+            cache.set(cache_key, response)
+        lines, chars = _convert_scriptdle_data(data)
+        if verbose:
+            print(f"[llm_vision] Chunk {i+1}: {len(lines)} lines, {len(chars)} chars", flush=True)
+        return lines, chars, data.get("title")
 
-    return Scriptdle(
-        id=movie_id,
-        title=title or detected_title or source_file,
-        year=year,
-        characters=sorted(all_characters),
-        lines=all_lines
-    )
+    except Exception as e:
+        if verbose:
+            print(f"[llm_vision] Chunk {i+1} ERROR: {e}", flush=True)
+        logger.error(f"Error processing chunk {i+1}: {e}")
+        return None
 
 
-def _split_pdf_pages(pdf_bytes: bytes, pages_per_chunk: int) -> list[bytes]:
-    """Split PDF into chunks of N pages each."""
+def _split_pdf_pages(pdf_bytes: bytes, pages_per_chunk: int) -> Iterator[bytes]:
+    """Split PDF into chunks of N pages each, serializing one chunk at a time."""
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    total_pages = len(doc)
-
-    if total_pages <= pages_per_chunk:
-        doc.close()
-        return [pdf_bytes]
+    try:
+        total_pages = len(doc)
 
-    chunks = []
-    for start in range(0, total_pages, pages_per_chunk):
-        end = min(start + pages_per_chunk, total_pages)
+        if total_pages <= pages_per_chunk:
+            yield pdf_bytes
+            return
 
-        chunk_doc = fitz.open()
-        chunk_doc.insert_pdf(doc, from_page=start, to_page=end - 1)
+        for start in range(0, total_pages, pages_per_chunk):
+            end = min(start + pages_per_chunk, total_pages)
 
-        chunk_bytes = chunk_doc.tobytes()
-        chunks.append(chunk_bytes)
-        chunk_doc.close()
+            chunk_doc = fitz.open()
+            # Links and annotations are irrelevant to the model; skip copying them
+            chunk_doc.insert_pdf(doc, from_page=start, to_page=end - 1, links=False, annots=False)
 
-    doc.close()
-    return chunks
+            # no_new_id keeps the bytes (and so the LLM cache key) stable across runs
+            chunk_bytes = chunk_doc.tobytes(no_new_id=True)
+            chunk_doc.close()
+            yield chunk_bytes
+    finally:
+        doc.close()
 
 
-def _build_vision_prompt(chunk_idx: int, total_chunks: int, pages_per_chunk: int) -> str:
+def _build_vision_prompt(chunk_idx: int, pages_per_chunk: int) -> str:
     """Build the LLM prompt for PDF vision parsing."""
     if chunk_idx == 0:
         return """Analyze this screenplay/transcript PDF and extract all dialogue lines.
@@ -164,21 +251,22 @@ Output valid JSON with the dialogue lines from these pages:"""
 def _parse_json_response(response: str) -> Optional[dict]:
     """Parse JSON from LLM response."""
     try:
-        return json.loads(response)
+        return json_loads(response)
     except json.JSONDecodeError:
         pass
 
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)(?:\s*```|$)', response)
+    json_match = JSON_FENCE_PATTERN.search(response)
     if json_match:
         try:
-            return json.loads(json_match.group(1).strip())
+            return json_loads(json_match.group(1).strip())
         except json.JSONDecodeError:
             pass
 
+    # raw_decode stops at the end of the object instead of failing on trailing prose
     start = response.find('{')
     if start >= 0:
         try:
-            return json.loads(response[start:])
+            return JSON_DECODER.raw_decode(response, start)[0]
         except json.JSONDecodeError:
             pass
 
@@ -213,13 +301,3 @@ def _convert_scriptdle_data(data: dict) -> Tuple[List[DialogueLine], set[str]]:
             characters.add(char.strip().upper())
 
     return lines, characters
-
-
-def _slugify(text: str) -> str:
-    """Convert text to a URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    text = text.strip('-')
-    return text
@@ -5,12 +5,19 @@ Defines the flat dialogue list format required by the Scriptdle game.
 Uses Pydantic for validation and serialization.
 """
 
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from typing import Optional
 
 
-class DialogueLine(BaseModel):
-    """A single line of dialogue."""
+@dataclass(slots=True, frozen=True)
+class DialogueLine:
+    """
+    A single line of dialogue.
+
+    A plain dataclass rather than a model: parsers build one per line, and
+    Pydantic still validates and dumps it as a field of Scriptdle.
+    """
     character: str
     text: str
 
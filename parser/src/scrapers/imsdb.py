@@ -9,14 +9,27 @@ IMSDb provides free movie scripts in HTML format. This scraper:
 
 import os
 import re
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, quote
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..utils.html_utils import HTML_PARSER
+from ..utils.json_utils import json_dumps, json_loads
+
+try:
+    from requests_cache import CachedSession
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    CachedSession = None
+    HTTP_CACHE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -24,38 +37,111 @@ BASE_URL = "https://imsdb.com"
 ALL_SCRIPTS_URL = f"{BASE_URL}/all-scripts.html"
 SCRIPT_URL_TEMPLATE = f"{BASE_URL}/scripts/{{title}}.html"
 
+# How long the cached all-scripts index stays valid, in seconds
+INDEX_TTL = 24 * 60 * 60
+
+# Only these parts of each page are parsed
+LINKS_ONLY = SoupStrainer("a", href=True)
+SCRIPT_TEXT_ONLY = SoupStrainer(["pre", "td"], class_="scrtext")
+
+FILENAME_INVALID_PATTERN = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATOR_PATTERN = re.compile(r'[-\s]+')
+
 
 class IMSDbScraper:
     """Scraper for downloading screenplays from IMSDb."""
 
-    def __init__(self, output_dir: str = "data/scripts/imsdb", delay: float = 1.0):
+    def __init__(
+        self,
+        output_dir: str = "data/scripts/imsdb",
+        delay: float = 1.0,
+        max_workers: int = 4,
+        http_cache: bool = True,
+    ):
         """
         Initialize the scraper.
 
         Args:
             output_dir: Directory to save downloaded scripts
-            delay: Delay between requests in seconds (be nice to the server)
+            delay: Minimum time between request starts in seconds, across all
+                workers (be nice to the server)
+            max_workers: Scripts downloaded concurrently by scrape_all
+            http_cache: Cache responses in <output_dir>/_http_cache.sqlite
+                for INDEX_TTL, revalidating with conditional requests after
+                that (requires requests-cache)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.delay = delay
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.index_path = self.output_dir / "_index.json"
+        if http_cache and HTTP_CACHE_AVAILABLE:
+            self.session = CachedSession(
+                cache_name=str(self.output_dir / "_http_cache"),
+                backend="sqlite",
+                expire_after=INDEX_TTL,
+                stale_if_error=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _get(self, url: str) -> requests.Response:
+        """GET a URL, spacing request starts at least `delay` seconds apart."""
+        if self._is_fresh_in_cache(url):
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response
+
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.delay
+
+        if start_at > now:
+            time.sleep(start_at - now)
+
+        response = self.session.get(url)
+        response.raise_for_status()
+        return response
+
+    def _is_fresh_in_cache(self, url: str) -> bool:
+        """Check whether a GET of url will be served from the HTTP cache without a request."""
+        if not (HTTP_CACHE_AVAILABLE and isinstance(self.session, CachedSession)):
+            return False
+        cache = self.session.cache
+        cached = cache.get_response(cache.create_key(requests.Request("GET", url)))
+        return cached is not None and not cached.is_expired
 
     def get_all_script_links(self) -> list[dict]:
         """
         Get list of all available scripts from IMSDb.
 
+        The list is cached in index_path and reused for INDEX_TTL seconds.
+
         Returns:
             List of dicts with 'title' and 'url' keys
         """
+        try:
+            if time.time() - self.index_path.stat().st_mtime < INDEX_TTL:
+                scripts = json_loads(self.index_path.read_bytes())
+                logger.info(f"Loaded {len(scripts)} scripts from cached index")
+                return scripts
+        except (OSError, ValueError):
+            pass
+
         logger.info("Fetching list of all scripts from IMSDb...")
-        response = self.session.get(ALL_SCRIPTS_URL)
-        response.raise_for_status()
+        response = self._get(ALL_SCRIPTS_URL)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=LINKS_ONLY)
         scripts = []
 
         for link in soup.find_all("a", href=True):
@@ -69,6 +155,11 @@ class IMSDbScraper:
                     })
 
         logger.info(f"Found {len(scripts)} scripts on IMSDb")
+
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(json_dumps(scripts))
+        tmp_path.replace(self.index_path)
+
         return scripts
 
     def get_script_page(self, script_info: dict) -> Optional[str]:
@@ -82,10 +173,9 @@ class IMSDbScraper:
             URL to the actual script content, or None if not found
         """
         try:
-            response = self.session.get(script_info["url"])
-            response.raise_for_status()
+            response = self._get(script_info["url"])
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=LINKS_ONLY)
 
             for link in soup.find_all("a", href=True):
                 if "/scripts/" in link.get("href", "").lower():
@@ -108,10 +198,11 @@ class IMSDbScraper:
             The script content as HTML, or None if failed
         """
         try:
-            response = self.session.get(script_url)
-            response.raise_for_status()
+            response = self._get(script_url)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            # html.parser keeps saved scripts byte-identical to earlier downloads;
+            # lxml repairs the script markup differently
+            soup = BeautifulSoup(response.text, "html.parser", parse_only=SCRIPT_TEXT_ONLY)
 
             script_pre = soup.find("pre", class_="scrtext")
             if script_pre:
@@ -128,6 +219,20 @@ class IMSDbScraper:
             logger.error(f"Error downloading script {title}: {e}")
             return None
 
+    def script_path(self, title: str) -> Path:
+        """
+        Get the path a script is saved to.
+
+        Args:
+            title: Title of the script
+
+        Returns:
+            Path under output_dir with a filesystem-safe name
+        """
+        safe_title = FILENAME_INVALID_PATTERN.sub('', title).strip()
+        safe_title = FILENAME_SEPARATOR_PATTERN.sub('-', safe_title)
+        return self.output_dir / f"{safe_title}.html"
+
     def save_script(self, content: str, title: str) -> Path:
         """
         Save script content to a file.
@@ -139,13 +244,12 @@ class IMSDbScraper:
         Returns:
             Path to the saved file
         """
-        safe_title = re.sub(r'[^\w\s-]', '', title).strip()
-        safe_title = re.sub(r'[-\s]+', '-', safe_title)
-        filename = f"{safe_title}.html"
-        filepath = self.output_dir / filename
+        filepath = self.script_path(title)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write then rename, so an interrupted run never leaves a partial script behind
+        tmp_path = filepath.with_suffix(".html.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(filepath)
 
         logger.info(f"Saved script: {filepath}")
         return filepath
@@ -162,20 +266,19 @@ class IMSDbScraper:
         """
         title = script_info["title"]
 
-        safe_title = re.sub(r'[^\w\s-]', '', title).strip()
-        safe_title = re.sub(r'[-\s]+', '-', safe_title)
-        filepath = self.output_dir / f"{safe_title}.html"
-        if filepath.exists():
-            logger.info(f"Script already exists: {title}")
-            return filepath
+        filepath = self.script_path(title)
+        try:
+            if filepath.stat().st_size > 0:
+                logger.info(f"Script already exists: {title}")
+                return filepath
+        except OSError:
+            pass
 
         script_url = self.get_script_page(script_info)
         if not script_url:
             logger.warning(f"Could not find script URL for {title}")
             return None
 
-        time.sleep(self.delay)
-
         content = self.download_script(script_url, title)
         if not content:
             return None
@@ -197,15 +300,13 @@ class IMSDbScraper:
         if limit:
             scripts = scripts[:limit]
 
-        saved_paths = []
-        for i, script_info in enumerate(scripts):
+        def scrape(i: int, script_info: dict) -> Optional[Path]:
             logger.info(f"Processing {i+1}/{len(scripts)}: {script_info['title']}")
+            return self.scrape_script(script_info)
 
-            path = self.scrape_script(script_info)
-            if path:
-                saved_paths.append(path)
-
-            time.sleep(self.delay)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(scrape, i, info) for i, info in enumerate(scripts)]
+            saved_paths = [path for future in futures if (path := future.result())]
 
         logger.info(f"Successfully scraped {len(saved_paths)} scripts")
         return saved_paths
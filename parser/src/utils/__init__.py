@@ -5,12 +5,23 @@ from .text_cleaning import (
     remove_translation_markers,
     clean_dialogue,
     clean_text,
+    slugify,
 )
 
+# JSON (orjson when installed)
+from .json_utils import json_dumps, json_loads
+
+# BeautifulSoup parser (lxml when installed)
+from .html_utils import HTML_PARSER
+
 __all__ = [
     "fix_ocr_errors",
     "remove_script_artifacts",
     "remove_translation_markers",
     "clean_dialogue",
     "clean_text",
+    "slugify",
+    "json_dumps",
+    "json_loads",
+    "HTML_PARSER",
 ]
@@ -0,0 +1,10 @@
+"""
+HTML Utilities
+
+Picks the BeautifulSoup parser: lxml when installed (several times faster
+on large pages), otherwise the standard library's html.parser.
+"""
+
+from importlib.util import find_spec
+
+HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
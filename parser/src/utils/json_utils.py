@@ -0,0 +1,60 @@
+"""
+JSON Utilities
+
+Serialize and parse JSON with orjson when it is installed, falling back to
+the standard library. Both backends write compact or 2-space-indented
+UTF-8 and raise json.JSONDecodeError on bad input, but the bytes can differ
+in places (float exponents, escaping of some characters), so output is only
+equivalent JSON, not byte-identical.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON.
+
+    Non-ASCII characters are written as-is rather than \\u-escaped.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation (compact otherwise)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
@@ -6,59 +6,66 @@ Handles:
 - Translation marker removal
 - Script artifact removal (page numbers, revision markers)
 - Character name detection in dialogue
+- Slug generation for movie IDs
 """
 
 import re
 from typing import Optional, Tuple, List
 
 
-OCR_CORRECTIONS = [
-    (r"\b([A-Z])'11\b", r"\1'll"),
-    (r"\bI'11\b", "I'll"),
-    (r"\bhe'11\b", "he'll"),
-    (r"\bshe'11\b", "she'll"),
-    (r"\bwe'11\b", "we'll"),
-    (r"\bthey'11\b", "they'll"),
-    (r"\byou'11\b", "you'll"),
-    (r"\bit'11\b", "it'll"),
-    (r"\bthat'11\b", "that'll"),
-    (r"\bwho'11\b", "who'll"),
-    (r"\bwhat'11\b", "what'll"),
-    (r"\bwon'1\b", "won't"),
-    (r"\bcan'1\b", "can't"),
-    (r"\bdon'1\b", "don't"),
-    (r"\bdoesn'1\b", "doesn't"),
-    (r"\bdidn'1\b", "didn't"),
-    (r"\bwouldn'1\b", "wouldn't"),
-    (r"\bcouldn'1\b", "couldn't"),
-    (r"\bshouldn'1\b", "shouldn't"),
-    (r"\bhaven'1\b", "haven't"),
-    (r"\bhasn'1\b", "hasn't"),
-    (r"\bisn'1\b", "isn't"),
-    (r"\baren'1\b", "aren't"),
-    (r"\bwasn'1\b", "wasn't"),
-    (r"\bweren'1\b", "weren't"),
-    (r"\btbe\b", "the"),
-    (r"\bwbat\b", "what"),
-    (r"\bwben\b", "when"),
-    (r"\bwbere\b", "where"),
-    (r"\bwby\b", "why"),
-    (r"\bwbo\b", "who"),
-    (r"\btbat\b", "that"),
-    (r"\btbis\b", "this"),
-    (r"\btbey\b", "they"),
-    (r"\btben\b", "then"),
-    (r"\btbere\b", "there"),
-    (r"\btbose\b", "those"),
-    (r"\btbese\b", "these"),
-    (r"\btbink\b", "think"),
-    (r"\btbing\b", "thing"),
-    (r"\btbings\b", "things"),
-    (r"(?<=[a-z])1(?=[a-z])", "l"),
-    (r"(?<=[A-Z])0(?=[A-Z])", "O"),
-]
+# Whole-word misreads, fixed case-insensitively in a single pass. A single
+# letter followed by '11 (e.g. "I'11") is also matched and keeps its case.
+OCR_WORD_CORRECTIONS = {
+    "he'11": "he'll",
+    "she'11": "she'll",
+    "we'11": "we'll",
+    "they'11": "they'll",
+    "you'11": "you'll",
+    "it'11": "it'll",
+    "that'11": "that'll",
+    "who'11": "who'll",
+    "what'11": "what'll",
+    "won'1": "won't",
+    "can'1": "can't",
+    "don'1": "don't",
+    "doesn'1": "doesn't",
+    "didn'1": "didn't",
+    "wouldn'1": "wouldn't",
+    "couldn'1": "couldn't",
+    "shouldn'1": "shouldn't",
+    "haven'1": "haven't",
+    "hasn'1": "hasn't",
+    "isn'1": "isn't",
+    "aren'1": "aren't",
+    "wasn'1": "wasn't",
+    "weren'1": "weren't",
+    "tbe": "the",
+    "wbat": "what",
+    "wben": "when",
+    "wbere": "where",
+    "wby": "why",
+    "wbo": "who",
+    "tbat": "that",
+    "tbis": "this",
+    "tbey": "they",
+    "tben": "then",
+    "tbere": "there",
+    "tbose": "those",
+    "tbese": "these",
+    "tbink": "think",
+    "tbing": "thing",
+    "tbings": "things",
+}
+
+OCR_WORD_PATTERN = re.compile(
+    r"\b(?:[A-Z]'11|" + "|".join(map(re.escape, OCR_WORD_CORRECTIONS)) + r")\b",
+    re.IGNORECASE
+)
 
-OCR_PATTERNS = [(re.compile(p, re.IGNORECASE if p[0] != '(' else 0), r) for p, r in OCR_CORRECTIONS]
+OCR_CHAR_PATTERNS = [
+    (re.compile(r"(?<=[a-z])1(?=[a-z])"), "l"),
+    (re.compile(r"(?<=[A-Z])0(?=[A-Z])"), "O"),
+]
 
 SCRIPT_ARTIFACTS = [
     re.compile(r'\b(YELLOW|BLUE|PINK|GREEN|GOLDENROD|BUFF|SALMON|CHERRY|TAN|WHITE|REVISED?)\s+\d{1,2}/\d{1,2}/\d{2,4}\b', re.IGNORECASE),
@@ -67,12 +74,29 @@ SCRIPT_ARTIFACTS = [
     re.compile(r'\s+\d+\s*$'),
 ]
 
+# Every artifact pattern requires a digit, so text without one can skip them
+DIGIT_PATTERN = re.compile(r'\d')
+
 TRANSLATION_MARKER_PATTERN = re.compile(r'<<\s*|\s*>>')
 
 CHARACTER_AT_END_PATTERN = re.compile(
     r'\s+([A-Z][A-Z\s\'\-]{1,25})\s*$'
 )
 
+# Capitalized words that end a line without being a character name
+NON_NAMES = frozenset({
+    'THE', 'AND', 'BUT', 'FOR', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD',
+    'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'HAS', 'HIS', 'HOW', 'ITS',
+    'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'WAY', 'WHO', 'DID', 'GET',
+    'HIM', 'LET', 'PUT', 'SAY', 'TOO', 'USE', 'YES', 'NO', 'WHAT',
+    'WITH', 'HAVE', 'THIS', 'YOUR', 'FROM', 'THEY', 'BEEN',
+    'MANY', 'SOME', 'THEM', 'THEN', 'WERE', 'SAID', 'EACH',
+})
+
+SLUG_SEPARATOR_PATTERN = re.compile(r'[\s_]+')
+SLUG_INVALID_PATTERN = re.compile(r'[^a-z0-9-]')
+SLUG_DASHES_PATTERN = re.compile(r'-+')
+
 
 def fix_ocr_errors(text: str) -> str:
     """
@@ -84,11 +108,19 @@ def fix_ocr_errors(text: str) -> str:
     Returns:
         Cleaned text with OCR errors corrected
     """
-    for pattern, replacement in OCR_PATTERNS:
+    text = OCR_WORD_PATTERN.sub(_replace_ocr_word, text)
+    for pattern, replacement in OCR_CHAR_PATTERNS:
         text = pattern.sub(replacement, text)
     return text
 
 
+def _replace_ocr_word(match: re.Match) -> str:
+    word = match.group()
+    if word[1] == "'":
+        return word[0] + "'ll"
+    return OCR_WORD_CORRECTIONS[word.lower()]
+
+
 def remove_script_artifacts(text: str) -> str:
     """
     Remove script artifacts like page numbers and revision markers.
@@ -99,6 +131,9 @@ def remove_script_artifacts(text: str) -> str:
     Returns:
         Text with artifacts removed
     """
+    if not DIGIT_PATTERN.search(text):
+        return text.strip()
+
     for pattern in SCRIPT_ARTIFACTS:
         text = pattern.sub('', text)
     return text.strip()
@@ -132,15 +167,8 @@ def detect_character_at_end(text: str) -> Tuple[str, Optional[str]]:
         potential_name = match.group(1).strip()
         words = potential_name.split()
         if 1 <= len(words) <= 3:
-            non_names = {
-                'THE', 'AND', 'BUT', 'FOR', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD',
-                'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'HAS', 'HIS', 'HOW', 'ITS',
-                'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'WAY', 'WHO', 'DID', 'GET',
-                'HIM', 'LET', 'PUT', 'SAY', 'TOO', 'USE', 'YES', 'NO', 'WHAT',
-                'WITH', 'HAVE', 'THIS', 'YOUR', 'FROM', 'THEY', 'BEEN',
-                'HAVE', 'MANY', 'SOME', 'THEM', 'THEN', 'WERE', 'SAID', 'EACH',
-            }
-            is_common_word = potential_name in non_names or any(w in non_names for w in words)
+            # A single-word name is its own only word, so this covers it too
+            is_common_word = not NON_NAMES.isdisjoint(words)
 
             before = text[:match.start()].strip()
             ends_with_punct = before and before[-1] in '.!?'
@@ -183,3 +211,20 @@ def clean_text(text: str) -> str:
     text = fix_ocr_errors(text)
     text = remove_script_artifacts(text)
     return text.strip()
+
+
+def slugify(text: str) -> str:
+    """
+    Convert text to a URL-friendly slug.
+
+    Args:
+        text: Input text (e.g. a movie title)
+
+    Returns:
+        Lowercase slug of a-z, 0-9 and single dashes
+    """
+    text = text.lower()
+    text = SLUG_SEPARATOR_PATTERN.sub('-', text)
+    text = SLUG_INVALID_PATTERN.sub('', text)
+    text = SLUG_DASHES_PATTERN.sub('-', text)
+    return text.strip('-')